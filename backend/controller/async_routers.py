@@ -0,0 +1,48 @@
+import inspect
+import functools
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.model.db import get_async_db
+from backend.controller.fast_json import FastJSONResponse
+from backend.controller.routers import SHARED_ROUTES
+
+
+# ============================================================
+# ⚡ Async Planes Router — async handlers for the hot /planes routes
+# ============================================================
+# Only included when DB_ASYNC=1. It is registered before plane_router,
+# so these handlers take over the matching routes; everything else
+# (e.g. /planes/stream) is still served by the sync router.
+# There are no separate async handlers: every @shared_route handler of
+# routers.py is wrapped so that it runs inside AsyncSession.run_sync —
+# the same code, with all database I/O going through the async driver
+# instead of holding a threadpool worker.
+# Item routes use the `int` path convertor so they never shadow static
+# sync-only paths such as /planes/stream.
+
+async_plane_router = APIRouter(prefix="/planes", tags=["Planes"], default_response_class=FastJSONResponse)
+
+
+def async_endpoint(handler):
+    """
+    Async twin of a sync route handler taking `db: Session = Depends(get_db)`.
+    - Same parameters (FastAPI reads __signature__), but `db` is an AsyncSession
+    - The handler runs in one run_sync call on that session's connection
+    """
+    signature = inspect.signature(handler)
+    parameters = [
+        p.replace(annotation=AsyncSession, default=Depends(get_async_db)) if p.name == "db" else p
+        for p in signature.parameters.values()
+    ]
+
+    @functools.wraps(handler)
+    async def endpoint(db: AsyncSession, **kwargs):
+        return await db.run_sync(lambda session: handler(db=session, **kwargs))
+
+    endpoint.__signature__ = signature.replace(parameters=parameters)
+    return endpoint
+
+
+for method, path, handler, options in SHARED_ROUTES:
+    route = getattr(async_plane_router, method)(path.replace("{plane_id}", "{plane_id:int}"), **options)
+    route(async_endpoint(handler))
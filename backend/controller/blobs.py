@@ -0,0 +1,215 @@
+import os
+import re
+import hashlib
+import tempfile
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+from fastapi import HTTPException, Request
+from starlette.concurrency import run_in_threadpool
+from python_multipart import MultipartParser
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import parse_options_header
+
+
+# ============================================================
+# 🧱 Blob store — uploaded plane pictures, addressed by content
+# ============================================================
+# POST /planes/{id}/picture streams a multipart upload straight into
+# BLOB_DIR (chunk by chunk, hashing on the fly) and points the plane's
+# Picture at GET /blobs/<sha256>.<ext>.
+# - Identical images are stored once (the file name is their SHA-256)
+# - Blobs never change, so they are served with immutable cache headers,
+#   ETag / If-Modified-Since (304) and Range requests
+# - Only JPEG, PNG, GIF and WebP are accepted (checked by magic bytes)
+
+BLOB_DIR = os.getenv("BLOB_DIR", "blob_store")
+
+# Largest accepted upload, in bytes
+BLOB_MAX_BYTES = int(os.getenv("BLOB_MAX_BYTES", str(20 * 1024 * 1024)))
+
+BLOB_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+MEDIA_TYPES = {"jpg": "image/jpeg", "png": "image/png", "gif": "image/gif", "webp": "image/webp"}
+
+_NAME = re.compile(r"^([0-9a-f]{64})\.(jpg|png|gif|webp)$")
+
+
+def _sniff(head: bytes) -> str | None:
+    """File extension for the image format in the first bytes, or None."""
+    if head.startswith(b"\xff\xd8\xff"):
+        return "jpg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if head.startswith((b"GIF87a", b"GIF89a")):
+        return "gif"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    return None
+
+
+def blob_path(name: str) -> str:
+    """Path of a stored blob; raises 404 for malformed or unknown names."""
+    match = _NAME.match(name)
+    path = os.path.join(BLOB_DIR, name[:2], name) if match else None
+    if not path or not os.path.isfile(path):
+        raise HTTPException(status_code=404, detail="Blob not found")
+    return path
+
+
+def path_for_url(url: str, origin: str) -> str | None:
+    """
+    Local path of a /blobs/<name> URL already in the store (None otherwise).
+    - `origin` is this API's base URL; blob URLs of other hosts are not local
+    - Server-relative paths (/blobs/<name>, as stored by uploads) are local
+    """
+    parts, base = urlsplit(url), urlsplit(origin)
+    prefix = base.path.rstrip("/") + "/blobs/"
+    relative = not parts.scheme and not parts.netloc
+    same_origin = (parts.scheme, parts.netloc.lower()) == (base.scheme, base.netloc.lower())
+    if not (relative or same_origin) or not parts.path.startswith(prefix):
+        return None
+    name = parts.path[len(prefix):]
+    try:
+        return blob_path(name)
+    except HTTPException:
+        return None
+
+
+def not_modified(request: Request, name: str, path: str) -> bool:
+    """True if the client's If-None-Match / If-Modified-Since still matches the blob."""
+    header = request.headers.get("if-none-match")
+    if header:
+        return header.strip() == "*" or etag(name) in [t.strip().removeprefix("W/") for t in header.split(",")]
+    since = request.headers.get("if-modified-since")
+    if since:
+        try:
+            return int(os.stat(path).st_mtime) <= parsedate_to_datetime(since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def etag(name: str) -> str:
+    return f'"{name.split(".")[0]}"'
+
+
+class BlobWriter:
+    """Writes one upload to a temp file in BLOB_DIR while hashing and checking it."""
+
+    def __init__(self, max_bytes: int = BLOB_MAX_BYTES):
+        self.max_bytes = max_bytes
+        tmp_dir = os.path.join(BLOB_DIR, "tmp")
+        os.makedirs(tmp_dir, exist_ok=True)
+        fd, self.tmp_path = tempfile.mkstemp(dir=tmp_dir, suffix=".part")
+        self._file = os.fdopen(fd, "wb")
+        self._hash = hashlib.sha256()
+        self._head = b""
+        self.extension = None
+        self.size = 0
+
+    def write(self, pieces):
+        """Append a list of byte strings (one network chunk)."""
+        for data in pieces:
+            self.size += len(data)
+            if self.size > self.max_bytes:
+                raise HTTPException(status_code=413, detail=f"Picture is larger than {self.max_bytes} bytes")
+            if self.extension is None:
+                self._head += data[:12]
+                if len(self._head) >= 12:
+                    self._check_format()
+            self._hash.update(data)
+            self._file.write(data)
+
+    def _check_format(self):
+        self.extension = _sniff(self._head)
+        if self.extension is None:
+            raise HTTPException(status_code=415, detail="Picture must be a JPEG, PNG, GIF or WebP image")
+
+    def commit(self) -> str:
+        """Move the upload to its content address and return the blob name."""
+        self._file.close()
+        if self.extension is None:
+            self._check_format()  # Uploads shorter than the sniffed header
+        name = f"{self._hash.hexdigest()}.{self.extension}"
+        folder = os.path.join(BLOB_DIR, name[:2])
+        os.makedirs(folder, exist_ok=True)
+        target = os.path.join(folder, name)
+        if os.path.exists(target):
+            os.remove(self.tmp_path)  # Same image already stored
+        else:
+            os.replace(self.tmp_path, target)
+        return name
+
+    def abort(self):
+        self._file.close()
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+
+async def receive_upload(request: Request, field: str = "file") -> str:
+    """
+    Stream the `field` part of a multipart/form-data request into the blob store.
+    - Chunks go to disk as they arrive (file writes run in the threadpool)
+    - Returns the blob name; raises 400/413/415 for bad uploads
+    """
+    content_type, options = parse_options_header(request.headers.get("content-type", ""))
+    boundary = options.get(b"boundary")
+    if content_type != b"multipart/form-data" or not boundary:
+        raise HTTPException(status_code=400, detail="Expected a multipart/form-data upload")
+
+    part = {"headers": {}, "field": b"", "value": b""}
+    pieces = []       # File data parsed from the current network chunk
+    state = {"in_file": False, "found": False}
+
+    def on_part_begin():
+        part["headers"] = {}
+
+    def on_header_field(data, start, end):
+        part["field"] += data[start:end]
+
+    def on_header_value(data, start, end):
+        part["value"] += data[start:end]
+
+    def on_header_end():
+        part["headers"][part["field"].lower()] = part["value"]
+        part["field"] = part["value"] = b""
+
+    def on_headers_finished():
+        _, params = parse_options_header(part["headers"].get(b"content-disposition", b""))
+        state["in_file"] = not state["found"] and params.get(b"name") == field.encode()
+        state["found"] = state["found"] or state["in_file"]
+
+    def on_part_data(data, start, end):
+        if state["in_file"]:
+            pieces.append(bytes(data[start:end]))
+
+    def on_part_end():
+        state["in_file"] = False
+
+    parser = MultipartParser(boundary, {
+        "on_part_begin": on_part_begin,
+        "on_header_field": on_header_field,
+        "on_header_value": on_header_value,
+        "on_header_end": on_header_end,
+        "on_headers_finished": on_headers_finished,
+        "on_part_data": on_part_data,
+        "on_part_end": on_part_end,
+    })
+
+    writer = BlobWriter()
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+            if pieces:
+                await run_in_threadpool(writer.write, pieces[:])
+                pieces.clear()
+        parser.finalize()
+        if not state["found"]:
+            raise HTTPException(status_code=400, detail=f"Missing '{field}' file part")
+        return await run_in_threadpool(writer.commit)
+    except MultipartParseError:
+        writer.abort()
+        raise HTTPException(status_code=400, detail="Malformed multipart body")
+    except Exception:
+        writer.abort()
+        raise
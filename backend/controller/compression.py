@@ -0,0 +1,33 @@
+import re
+from starlette.middleware.gzip import GZipMiddleware
+
+
+# ============================================================
+# 🗜️ Compression — gzip for JSON, never for streams or images
+# ============================================================
+# GZipMiddleware buffers a streaming body until its compressor emits a
+# block, so an NDJSON stream would reach the client in large, late bursts
+# instead of line by line. Images are already compressed: gzip would only
+# cost CPU (and drop Range support). Paths matching UNCOMPRESSED_PATHS
+# bypass the middleware.
+
+UNCOMPRESSED_PATHS = (
+    r"/planes/stream",            # NDJSON: each chunk must be sent as soon as it is produced
+    r"/planes/(\d+/)?thumbnail",  # JPEG thumbnails
+    r"/blobs/[^/]+",              # Uploaded pictures
+)
+
+
+class SelectiveGZipMiddleware:
+    """GZipMiddleware for every request except the UNCOMPRESSED_PATHS."""
+
+    def __init__(self, app, minimum_size: int = 1024, skip_paths=UNCOMPRESSED_PATHS):
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+        self.skip = [re.compile(f"{path}$") for path in skip_paths]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and any(p.search(scope["path"]) for p in self.skip):
+            await self.app(scope, receive, send)
+        else:
+            await self.gzip(scope, receive, send)
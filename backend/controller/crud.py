@@ -1,8 +1,229 @@
-from sqlalchemy.orm import Session
-from backend.model.models import Plane
-from backend.model.schemas import PlaneCreate, PlaneUpdate
+import os
+import time
+import logging
+from sqlalchemy import delete, func, insert, literal, or_, select, text, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, load_only
+from backend.model.models import Plane, PlaneTombstone, TableVersion
+from backend.model.schemas import PlaneCreate, PlaneUpdate, PlanePatch, PlaneRead, PlaneBulkUpdate
+from backend.controller.response_cache import plane_cache
+from backend.controller import events
 from fastapi import HTTPException
 
+logger = logging.getLogger(__name__)
+
+
+# ---------- Pagination Settings ---------- #
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# How long (in seconds) a computed row count may be reused.
+# COUNT(*) scans the table (or an index), so results are cached per filter
+# combination and invalidated on writes.
+COUNT_CACHE_TTL = 30
+
+_count_cache = {}  # filter key → (count, expires_at)
+
+
+def _invalidate_caches():
+    """Drops cached aggregates and encoded responses after any write to the Planes table."""
+    _count_cache.clear()
+    plane_cache.clear()
+
+
+# ---------- Table Version ---------- #
+# The Planes table version is a counter incremented by every write.
+# It is used to build ETags: if the version did not change, neither did the data.
+
+PLANES_TABLE = Plane.__tablename__
+
+
+def get_table_version(db: Session) -> int:
+    """Return the current version of the Planes table (0 if never written)."""
+    version = (
+        db.query(TableVersion.Version)
+        .filter(TableVersion.TableName == PLANES_TABLE)
+        .scalar()
+    )
+    return version or 0
+
+
+def _bump_table_version(db: Session) -> int:
+    """
+    Increment the Planes table version inside the current transaction.
+    - The row lock is held until commit, so versions follow commit order
+    - The row is seeded by ensure_schema() at startup, so this is always an UPDATE
+    - Returns the new version (stamped on the written row as RowVersion)
+    """
+    bump = (
+        update(TableVersion)
+        .where(TableVersion.TableName == PLANES_TABLE)
+        .values(Version=TableVersion.Version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    if _dialect(db).update_returning:
+        # One round trip: UPDATE ... OUTPUT inserted.Version / RETURNING Version
+        version = db.scalars(bump.returning(TableVersion.Version)).first()
+        updated = version is not None
+    else:
+        updated = db.execute(bump).rowcount
+        version = get_table_version(db) if updated else None
+    if not updated:
+        raise RuntimeError(f"TableVersions has no row for {PLANES_TABLE}; ensure_schema() seeds it at startup")
+    return version
+
+
+def _dialect(db: Session):
+    """SQLAlchemy dialect of the session's connection (for RETURNING support checks)."""
+    return db.get_bind().dialect
+
+
+# ---------- Change Feed ---------- #
+# Every written row carries the table version of its write (RowVersion) and
+# every delete leaves a tombstone with the version of the delete, so a client
+# holding version V only needs the rows and tombstones newer than V.
+
+# INSERT ... ON CONFLICT constructs of the dialects that have one
+_UPSERT_INSERTS = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
+
+
+def _record_tombstones(db: Session, plane_ids, version: int):
+    """
+    Record (or refresh) tombstones for deleted planes inside the current transaction.
+    - One upsert executed for all IDs: MERGE on SQL Server,
+      INSERT ... ON CONFLICT DO UPDATE on SQLite/PostgreSQL
+    - Other dialects delete and re-insert the tombstones
+    """
+    rows = [{"PlaneId": pid, "RowVersion": version} for pid in sorted(set(plane_ids))]
+    dialect = _dialect(db)
+    if dialect.name == "mssql":
+        db.execute(text(_mssql_tombstone_merge(dialect, ":RowVersion")), rows)
+        return
+    upsert = _UPSERT_INSERTS.get(dialect.name)
+    if upsert is not None:
+        stmt = upsert(PlaneTombstone)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[PlaneTombstone.PlaneId],
+            set_={"RowVersion": stmt.excluded.RowVersion},
+        )
+        db.execute(stmt, rows)
+        return
+    for chunk in _chunks(rows):
+        db.execute(delete(PlaneTombstone).where(PlaneTombstone.PlaneId.in_([r["PlaneId"] for r in chunk])))
+        db.execute(insert(PlaneTombstone), chunk)
+
+
+# ---------- SQL Server Write Batches ---------- #
+# Every statement sent to a remote SQL Server costs a network round trip.
+# A single-row update or delete is therefore sent as ONE T-SQL batch:
+# the table version is bumped into @version, the tombstone is upserted
+# (deletes), and the row is written with OUTPUT. The OUTPUT statement comes
+# last — statements after a result set only run once the client reads past it.
+# If no row matches, the caller rolls the whole batch back (404).
+# NOCOUNT is ON for the statements before OUTPUT, so the client sees one
+# result set. It is a session setting that would outlive the batch on the
+# pooled connection (later statements reporting rowcount -1), so it is
+# switched OFF again before the OUTPUT statement and on any error.
+
+def _mssql_batch(prelude: str, output_statement: str) -> str:
+    """One T-SQL batch: `prelude` under NOCOUNT (reset on errors too), then `output_statement`."""
+    return (
+        "SET NOCOUNT ON;\n"
+        "DECLARE @version BIGINT;\n"
+        "BEGIN TRY\n"
+        f"{prelude}"
+        "END TRY\n"
+        "BEGIN CATCH\n"
+        "SET NOCOUNT OFF;\n"
+        "THROW;\n"
+        "END CATCH;\n"
+        "SET NOCOUNT OFF;\n"
+        f"{output_statement}"
+    )
+
+
+def _mssql_bump_version(dialect) -> str:
+    """Batch prelude: SET @version to the incremented Planes table version."""
+    q = dialect.identifier_preparer.quote
+    return (
+        f"UPDATE {q(TableVersion.__tablename__)} SET @version = {q('Version')} = {q('Version')} + 1 "
+        f"WHERE {q('TableName')} = :table_name;\n"
+        "IF @version IS NULL THROW 50000, 'TableVersions has no row for the table; "
+        "ensure_schema() seeds it at startup', 1;\n"
+    )
+
+
+def _mssql_tombstone_merge(dialect, version: str) -> str:
+    """MERGE upserting the tombstone of :PlaneId with `version` (a bind or a variable)."""
+    q = dialect.identifier_preparer.quote
+    table = q(PlaneTombstone.__tablename__)
+    return (
+        f"MERGE {table} WITH (HOLDLOCK) AS t "
+        f"USING (SELECT :PlaneId AS {q('PlaneId')}, {version} AS {q('RowVersion')}) AS s "
+        f"ON t.{q('PlaneId')} = s.{q('PlaneId')} "
+        f"WHEN MATCHED THEN UPDATE SET {q('RowVersion')} = s.{q('RowVersion')} "
+        f"WHEN NOT MATCHED THEN INSERT ({q('PlaneId')}, {q('RowVersion')}) "
+        f"VALUES (s.{q('PlaneId')}, s.{q('RowVersion')});\n"
+    )
+
+
+def _mssql_output(dialect, prefix: str) -> str:
+    """OUTPUT list of the PlaneRead columns from the `inserted` or `deleted` pseudo-table."""
+    q = dialect.identifier_preparer.quote
+    return ", ".join(f"{prefix}.{q(column.key)}" for column in PLANE_READ_COLUMNS)
+
+
+def _mssql_update_batch(dialect, columns):
+    """Version bump + UPDATE ... OUTPUT inserted.* of :PlaneId (one round trip)."""
+    q = dialect.identifier_preparer.quote
+    assignments = ", ".join(f"{q(name)} = :{name}" for name in columns)
+    sql = _mssql_batch(
+        _mssql_bump_version(dialect),
+        f"UPDATE {q(PLANES_TABLE)} SET {assignments}, {q('RowVersion')} = @version "
+        f"OUTPUT {_mssql_output(dialect, 'inserted')}, inserted.{q('RowVersion')} "
+        f"WHERE {q('PlaneId')} = :PlaneId;",
+    )
+    return text(sql).columns(*PLANE_READ_COLUMNS, Plane.RowVersion)
+
+
+def _mssql_delete_batch(dialect):
+    """Version bump + tombstone MERGE + DELETE ... OUTPUT deleted.* of :PlaneId (one round trip)."""
+    q = dialect.identifier_preparer.quote
+    sql = _mssql_batch(
+        _mssql_bump_version(dialect) + _mssql_tombstone_merge(dialect, "@version"),
+        f"DELETE FROM {q(PLANES_TABLE)} "
+        f"OUTPUT {_mssql_output(dialect, 'deleted')}, @version AS {q('DeleteVersion')} "
+        f"WHERE {q('PlaneId')} = :PlaneId;",
+    )
+    return text(sql)
+
+
+def get_changes(db: Session, since: int | None = None):
+    """
+    Return the planes written and the IDs deleted after version `since`.
+    - The current version is read first, so a concurrent write is reported
+      again on the next call rather than missed
+    - Without `since` only the current version is returned (a starting point)
+    """
+    version = get_table_version(db)
+    if since is None:
+        return {"version": version, "planes": [], "deleted": []}
+
+    planes = (
+        db.query(Plane)
+        .filter(Plane.RowVersion > since)
+        .order_by(Plane.RowVersion, Plane.PlaneId)
+        .all()
+    )
+    deleted = db.scalars(
+        select(PlaneTombstone.PlaneId)
+        .where(PlaneTombstone.RowVersion > since)
+        .order_by(PlaneTombstone.RowVersion, PlaneTombstone.PlaneId)
+    ).all()
+    return {"version": version, "planes": planes, "deleted": list(deleted)}
+
 
 # ---------- Plane CRUD Operations ---------- #
 
@@ -11,9 +232,201 @@ def get_all_planes(db: Session):
     return db.query(Plane).all()
 
 
-def get_plane_by_id(db: Session, plane_id: int):
-    """Retrieve a specific plane by its unique ID."""
-    return db.query(Plane).filter(Plane.PlaneId == plane_id).first()
+def _contains_pattern(text: str) -> str:
+    """LIKE pattern matching values that contain `text` (wildcards escaped with '/')."""
+    escaped = text.replace("/", "//").replace("%", "/%").replace("_", "/_")
+    return f"%{escaped}%"
+
+
+def _filtered_query(db: Session, q: str | None = None, made_by=None, years=None):
+    """
+    Build a Plane query with the search filters compiled into SQL.
+    - `q` is a substring of Name or MadeBy, ignoring case (the columns use a
+      case-insensitive collation). LIKE '%q%' cannot seek an index, but pages
+      are read in PlaneId order and stop after `limit` matches.
+    - `made_by` / `years` are lists of exact values (served by the MadeBy/Year indexes)
+    """
+    query = db.query(Plane)
+    if q:
+        pattern = _contains_pattern(q)
+        query = query.filter(
+            or_(
+                Plane.Name.like(pattern, escape="/"),
+                Plane.MadeBy.like(pattern, escape="/"),
+            )
+        )
+    if made_by:
+        query = query.filter(Plane.MadeBy.in_(made_by))
+    if years:
+        query = query.filter(Plane.Year.in_(years))
+    return query
+
+
+def get_planes_page(db: Session, after: int | None = None, limit: int = DEFAULT_PAGE_SIZE):
+    """
+    Retrieve one page of planes using keyset (cursor) pagination.
+    - Rows are ordered by PlaneId, so the primary key index drives the scan
+    - `after` is the last PlaneId of the previous page (None for the first page)
+    - Returns at most `limit` planes
+    """
+    return search_planes(db, after=after, limit=limit)
+
+
+def search_planes(
+    db: Session,
+    q: str | None = None,
+    made_by=None,
+    years=None,
+    after: int | None = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+):
+    """
+    Retrieve one page of planes matching the given filters.
+    - Filtering happens in the database, not in Python
+    - Uses the same keyset pagination as get_planes_page
+    """
+    query = _filtered_query(db, q, made_by, years)
+    if after is not None:
+        query = query.filter(Plane.PlaneId > after)
+    return query.order_by(Plane.PlaneId).limit(limit).all()
+
+
+# Columns of PlaneRead in its field order (= the JSON key order of the API)
+PLANE_READ_COLUMNS = tuple(getattr(Plane, field) for field in PlaneRead.model_fields)
+
+# Fields that can be selected with ?fields= (PlaneRead plus the computed TotalSeats)
+PROJECTABLE_FIELDS = (*PlaneRead.model_fields, "TotalSeats")
+
+
+def _projection(fields=None):
+    """Columns to SELECT for a field projection (all PlaneRead columns by default)."""
+    if not fields:
+        return PLANE_READ_COLUMNS
+    return tuple(getattr(Plane, field) for field in fields)
+
+
+def get_plane_rows(
+    db: Session,
+    q: str | None = None,
+    made_by=None,
+    years=None,
+    after: int | None = None,
+    limit: int | None = None,
+    fields=None,
+):
+    """
+    Fast path for list responses: same rows as search_planes, as column tuples.
+    - Selects only the PlaneRead columns (or the projected `fields`); no ORM objects are built
+    - `limit=None` returns every matching row (GET /planes without paging)
+    """
+    query = _filtered_query(db, q, made_by, years).with_entities(*_projection(fields))
+    if after is not None:
+        query = query.filter(Plane.PlaneId > after)
+    query = query.order_by(Plane.PlaneId)
+    if limit is not None:
+        query = query.limit(limit)
+    return query.all()
+
+
+def stream_planes(
+    db: Session, q: str | None = None, made_by=None, years=None, batch_size: int = 500
+):
+    """
+    Iterate over all planes matching the filters without loading them all at once.
+    - Uses a server-side cursor (`yield_per`), so rows are fetched in batches
+    - Yields Plane objects in PlaneId order
+    """
+    query = _filtered_query(db, q, made_by, years).order_by(Plane.PlaneId)
+    yield from query.yield_per(batch_size)
+
+
+def count_planes(db: Session, q: str | None = None, made_by=None, years=None):
+    """
+    Return the number of planes matching the given filters (all planes by default).
+    - The value is cached for COUNT_CACHE_TTL seconds
+    - The cache is dropped whenever a plane is created, updated or deleted
+    """
+    key = (q or "", tuple(sorted(made_by or ())), tuple(sorted(years or ())))
+    now = time.monotonic()
+    cached = _count_cache.get(key)
+    if cached is None or now >= cached[1]:
+        query = _filtered_query(db, q, made_by, years).with_entities(func.count(Plane.PlaneId))
+        cached = (query.scalar(), now + COUNT_CACHE_TTL)
+        _count_cache[key] = cached
+    return cached[0]
+
+
+def get_plane_stats(
+    db: Session, q: str | None = None, made_by=None, years=None, year_bucket: int = 1
+):
+    """
+    Aggregate plane statistics with GROUP BY in the database.
+    - Honors the same filters as search_planes
+    - Years are grouped into buckets of `year_bucket` years (labelled by the first year)
+    - Returns counts per manufacturer, counts per year bucket and seat totals per class
+    """
+    base = _filtered_query(db, q, made_by, years)
+
+    totals = base.with_entities(
+        func.count(Plane.PlaneId),
+        func.coalesce(func.sum(Plane.NumOfSeats1), 0),
+        func.coalesce(func.sum(Plane.NumOfSeats2), 0),
+        func.coalesce(func.sum(Plane.NumOfSeats3), 0),
+    ).one()
+
+    manufacturers = (
+        base.with_entities(Plane.MadeBy, func.count(Plane.PlaneId))
+        .group_by(Plane.MadeBy)
+        .order_by(func.count(Plane.PlaneId).desc(), Plane.MadeBy)
+        .all()
+    )
+
+    # The bucket width is rendered inline so SELECT and GROUP BY use the same expression
+    if year_bucket > 1:
+        width = literal(year_bucket, literal_execute=True)
+        bucket = ((Plane.Year // width) * width).label("bucket")
+    else:
+        bucket = Plane.Year.label("bucket")
+    year_rows = (
+        base.with_entities(bucket, func.count(Plane.PlaneId))
+        .group_by(bucket)
+        .order_by(bucket)
+        .all()
+    )
+
+    return {
+        "total": totals[0],
+        "year_bucket": year_bucket,
+        "manufacturers": [{"MadeBy": m, "count": c} for m, c in manufacturers],
+        "years": [{"Year": y, "count": c} for y, c in year_rows],
+        "seats": {
+            "NumOfSeats1": totals[1],
+            "NumOfSeats2": totals[2],
+            "NumOfSeats3": totals[3],
+        },
+    }
+
+
+def get_plane_by_id(db: Session, plane_id: int, fields=None):
+    """
+    Retrieve a specific plane by its unique ID.
+    - With `fields`, only those columns (plus RowVersion, for the ETag) are
+      loaded; the other attributes stay deferred
+    """
+    query = db.query(Plane).filter(Plane.PlaneId == plane_id)
+    if fields:
+        query = query.options(load_only(*_projection(fields), Plane.RowVersion))
+    return query.first()
+
+
+def plane_exists(db: Session, plane_id: int) -> bool:
+    """True if a plane with this ID exists (primary key lookup, no row loaded)."""
+    return db.query(Plane.PlaneId).filter(Plane.PlaneId == plane_id).first() is not None
+
+
+def picture_in_use(db: Session, picture: str) -> bool:
+    """True if at least one plane has this exact Picture value."""
+    return db.query(Plane.PlaneId).filter(Plane.Picture == picture).first() is not None
 
 
 def create_plane(db: Session, plane_data: PlaneCreate):
@@ -24,55 +437,255 @@ def create_plane(db: Session, plane_data: PlaneCreate):
     - Returns the created Plane object
     """
     new_plane = Plane(**plane_data.model_dump())
+    new_plane.RowVersion = _bump_table_version(db)
     db.add(new_plane)
     db.commit()
     db.refresh(new_plane)
+    _invalidate_caches()
+    events.plane_written("create", new_plane)
     return new_plane
 
 
 def update_plane(db: Session, plane_id: int, plane_data: PlaneUpdate):
     """
     Update an existing plane record by ID.
-    - Looks up the plane by ID
-    - Updates only provided fields
+    - One UPDATE ... OUTPUT inserted.* / RETURNING statement writes the row
+      and returns it (no SELECT before, no refresh after)
     - Raises 404 error if the plane does not exist
     """
-    plane = get_plane_by_id(db, plane_id)
+    return _update_columns(db, plane_id, plane_data.model_dump())
+
+
+def patch_plane(db: Session, plane_id: int, changes: PlanePatch):
+    """
+    Partially update a plane by ID.
+    - The UPDATE sets only the columns present in the request body
+    - An empty body writes nothing and returns the current plane
+    - Raises 404 error if the plane does not exist
+    """
+    values = changes.model_dump(exclude_unset=True)
+    if not values:
+        plane = get_plane_by_id(db, plane_id)
+        if not plane:
+            raise HTTPException(status_code=404, detail="Plane not found")
+        return plane
+    return _update_columns(db, plane_id, values)
+
+
+def _update_columns(db: Session, plane_id: int, values: dict):
+    """
+    Write `values` to one plane, stamp it with a new RowVersion and return it.
+    - SQL Server: one batch (version bump + UPDATE ... OUTPUT), one round trip
+    - Other dialects: version bump, then UPDATE ... RETURNING
+    """
+    dialect = _dialect(db)
+    if dialect.name == "mssql":
+        stmt = select(Plane).from_statement(_mssql_update_batch(dialect, values))
+        params = {**values, "PlaneId": plane_id, "table_name": PLANES_TABLE}
+        plane = db.scalars(stmt, params).first()
+    else:
+        version = _bump_table_version(db)
+        stmt = (
+            update(Plane)
+            .where(Plane.PlaneId == plane_id)
+            .values(**values, RowVersion=version)
+            .execution_options(synchronize_session=False)
+        )
+        if dialect.update_returning:
+            plane = db.scalars(stmt.returning(Plane)).first()
+        else:
+            plane = get_plane_by_id(db, plane_id) if db.execute(stmt).rowcount else None
     if not plane:
+        db.rollback()
         raise HTTPException(status_code=404, detail="Plane not found")
-    for key, value in plane_data.model_dump().items():
-        setattr(plane, key, value)
+
+    db.expunge(plane)  # Keep the returned values readable after commit (no reload)
     db.commit()
-    db.refresh(plane)
+    _invalidate_caches()
+    events.plane_written("update", plane)
     return plane
 
 
 def delete_plane(db: Session, plane_id: int):
     """
     Delete a plane record by ID.
-    - Validates existence of the plane
-    - Deletes it from the database
+    - The DELETE ... OUTPUT deleted.* / RETURNING statement removes the row
+      and returns its data (no SELECT first)
+    - SQL Server: version bump, tombstone and delete are one batch (one round trip)
+    - Raises 404 error if the plane does not exist
     - Returns structured response with details
     """
-    plane = get_plane_by_id(db, plane_id)
-    if not plane:
+    dialect = _dialect(db)
+    if dialect.name == "mssql":
+        params = {"PlaneId": plane_id, "table_name": PLANES_TABLE}
+        row = db.execute(_mssql_delete_batch(dialect), params).first()
+        if row is not None:
+            deleted_plane_data = row._asdict()
+            version = deleted_plane_data.pop("DeleteVersion")
+    else:
+        version = _bump_table_version(db)
+        stmt = (
+            delete(Plane)
+            .where(Plane.PlaneId == plane_id)
+            .execution_options(synchronize_session=False)
+        )
+        if dialect.delete_returning:
+            row = db.execute(stmt.returning(*PLANE_READ_COLUMNS)).first()
+        else:
+            row = db.query(*PLANE_READ_COLUMNS).filter(Plane.PlaneId == plane_id).first()
+            if row is not None:
+                db.execute(stmt)
+        if row is not None:
+            deleted_plane_data = row._asdict()
+            _record_tombstones(db, [plane_id], version)
+    if row is None:
+        db.rollback()
         raise HTTPException(status_code=404, detail="Plane not found")
-    
-    deleted_plane_data = {
-        "PlaneId": plane.PlaneId,
-        "Name": plane.Name,
-        "Year": plane.Year,
-        "MadeBy": plane.MadeBy,
-        "Picture": plane.Picture,
-        "NumOfSeats1": plane.NumOfSeats1,
-        "NumOfSeats2": plane.NumOfSeats2,
-        "NumOfSeats3": plane.NumOfSeats3,
-    }
 
-    db.delete(plane)
     db.commit()
-    
+    _invalidate_caches()
+    events.plane_deleted(plane_id, version)
+
     return {
         "detail": "Plane deleted successfully",
         "deleted_plane": deleted_plane_data
     }
+
+
+# ---------- Bulk Operations ---------- #
+# Each bulk call validates the whole batch up front (via the request schemas)
+# and writes it in a single transaction with executemany-style statements.
+
+MAX_BULK_ROWS = 10_000
+
+# Rows per IN (...) list — keeps well below SQL Server's 2100 parameter limit
+BULK_CHUNK_SIZE = 1000
+
+# Expected minimum throughput; slower bulk writes are logged as warnings.
+# Small batches are dominated by fixed per-request cost, so they are not checked.
+BULK_TARGET_ROWS_PER_SEC = int(os.getenv("BULK_TARGET_ROWS_PER_SEC", "2000"))
+BULK_TARGET_MIN_ROWS = 100
+
+
+def _chunks(items, size: int = BULK_CHUNK_SIZE):
+    """Split a list into consecutive chunks of at most `size` items."""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _existing_plane_ids(db: Session, plane_ids):
+    """Return the subset of `plane_ids` present in the database (one query per chunk)."""
+    found = set()
+    for chunk in _chunks(sorted(set(plane_ids))):
+        found.update(db.scalars(select(Plane.PlaneId).where(Plane.PlaneId.in_(chunk))))
+    return found
+
+
+def _missing_rows(plane_ids, found):
+    """Per-row errors for IDs that were not found."""
+    return [
+        {"index": i, "PlaneId": pid, "errors": ["Plane not found"]}
+        for i, pid in enumerate(plane_ids)
+        if pid not in found
+    ]
+
+
+def _log_throughput(operation: str, rows: int, started: float):
+    """Log the achieved rows/second of a bulk write and warn below the target."""
+    elapsed = max(time.perf_counter() - started, 1e-6)
+    rate = rows / elapsed
+    below_target = rows >= BULK_TARGET_MIN_ROWS and rate < BULK_TARGET_ROWS_PER_SEC
+    level = logging.WARNING if below_target else logging.INFO
+    logger.log(level, "bulk %s: %d rows in %.3fs (%.0f rows/s)", operation, rows, elapsed, rate)
+
+
+def bulk_create_planes(db: Session, planes: list[PlaneCreate]):
+    """
+    Insert many planes in one transaction.
+    - Uses a Core INSERT executed with the whole parameter list
+      (multi-row VALUES / pyodbc fast_executemany under the hood)
+    - Returns the new IDs in request order when the dialect can report them
+    """
+    started = time.perf_counter()
+    if not planes:
+        return {"detail": "No planes to create", "processed": 0, "PlaneIds": [], "errors": []}
+
+    version = _bump_table_version(db)
+    rows = [{**p.model_dump(), "RowVersion": version} for p in planes]
+
+    stmt = insert(Plane)
+    if db.get_bind().dialect.insert_executemany_returning_sort_by_parameter_order:
+        ids = list(db.scalars(stmt.returning(Plane.PlaneId, sort_by_parameter_order=True), rows))
+    else:
+        db.execute(stmt, rows)
+        ids = []
+    db.commit()
+    _invalidate_caches()
+    events.planes_bulk_written(version)
+
+    _log_throughput("create", len(rows), started)
+    return {
+        "detail": f"{len(rows)} planes created successfully",
+        "processed": len(rows),
+        "PlaneIds": ids,
+        "errors": [],
+    }
+
+
+def bulk_update_planes(db: Session, planes: list[PlaneBulkUpdate]):
+    """
+    Update many planes in one transaction.
+    - Missing IDs are reported per row; all other rows are written
+    - Uses an executemany UPDATE keyed by primary key
+    """
+    started = time.perf_counter()
+    plane_ids = [p.PlaneId for p in planes]
+    found = _existing_plane_ids(db, plane_ids)
+    errors = _missing_rows(plane_ids, found)
+
+    rows = [p.model_dump() for p in planes if p.PlaneId in found]
+    if rows:
+        version = _bump_table_version(db)
+        for row in rows:
+            row["RowVersion"] = version
+        db.execute(update(Plane), rows)
+        db.commit()
+        _invalidate_caches()
+        events.planes_bulk_written(version)
+
+    _log_throughput("update", len(rows), started)
+    return {
+        "detail": f"{len(rows)} planes updated successfully",
+        "processed": len(rows),
+        "PlaneIds": [row["PlaneId"] for row in rows],
+        "errors": errors,
+    }
+
+
+def bulk_delete_planes(db: Session, plane_ids: list[int]):
+    """
+    Delete many planes in one transaction.
+    - Missing IDs are reported per row; all other rows are deleted
+    - Issues one DELETE ... WHERE PlaneId IN (...) per chunk
+    """
+    started = time.perf_counter()
+    found = _existing_plane_ids(db, plane_ids)
+    errors = _missing_rows(plane_ids, found)
+
+    deleted = sorted(found)
+    if deleted:
+        version = _bump_table_version(db)
+        for chunk in _chunks(deleted):
+            db.execute(delete(Plane).where(Plane.PlaneId.in_(chunk)))
+        _record_tombstones(db, deleted, version)
+        db.commit()
+        _invalidate_caches()
+        events.planes_bulk_written(version)
+
+    _log_throughput("delete", len(deleted), started)
+    return {
+        "detail": f"{len(deleted)} planes deleted successfully",
+        "processed": len(deleted),
+        "PlaneIds": deleted,
+        "errors": errors,
+    }
@@ -0,0 +1,56 @@
+import hashlib
+from fastapi import Request, Response
+
+
+# ============================================================
+# 🏷️ ETag helpers — conditional GET support for plane endpoints
+# ============================================================
+# ETags are strong validators built from the Planes table version
+# (for list-style responses) or from a row's RowVersion (for items).
+
+def list_etag(request: Request, table_version: int) -> str:
+    """
+    Build the ETag of a list-style response.
+    - Changes whenever the table version changes
+    - Includes a hash of the query string, since each query has its own body
+    """
+    query = "&".join(sorted(str(request.query_params).split("&")))
+    digest = hashlib.sha1(f"{request.url.path}?{query}".encode()).hexdigest()[:16]
+    return f'"planes-{table_version}-{digest}"'
+
+
+def item_etag(plane, fields=None) -> str:
+    """
+    Build the ETag of a single plane from its id and row version.
+    - A field projection has its own body, so its ETag gets a suffix
+    """
+    if not fields:
+        return f'"plane-{plane.PlaneId}-{plane.RowVersion}"'
+    digest = hashlib.sha1(",".join(fields).encode()).hexdigest()[:8]
+    return f'"plane-{plane.PlaneId}-{plane.RowVersion}-{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Return True if the request's If-None-Match header matches `etag`."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return etag in candidates
+
+
+def not_modified(etag: str) -> Response:
+    """Return an empty 304 response carrying the current ETag."""
+    return Response(status_code=304, headers=etag_headers(etag))
+
+
+def etag_headers(etag: str) -> dict:
+    """Headers that carry the ETag and ask clients to revalidate it."""
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+
+def set_etag(response: Response, etag: str):
+    """Attach the ETag to a full response and ask clients to revalidate it."""
+    response.headers.update(etag_headers(etag))
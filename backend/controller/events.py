@@ -0,0 +1,96 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+from backend.model.schemas import PlaneRead
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# 📣 Plane events — change notifications pushed over /planes/ws
+# ============================================================
+# crud.py publishes one compact JSON message per committed write:
+#   {"op": "create" | "update", "v": 12, "plane": {...}}
+#   {"op": "delete", "v": 13, "id": 7}
+#   {"op": "bulk", "v": 14}            → clients fetch GET /planes/changes
+#   {"op": "resync"}                   → the subscriber fell behind
+# "v" is the Planes table version of the write, so clients can detect a gap
+# (a missed or reordered event) and fall back to the change feed.
+# Events are delivered to the subscribers of this process only.
+
+# Messages buffered per subscriber before it is asked to resync
+EVENT_QUEUE_SIZE = int(os.getenv("EVENT_QUEUE_SIZE", "1000"))
+
+
+def _encode(event: dict) -> str:
+    return json.dumps(event, separators=(",", ":"))
+
+
+class PlaneEventHub:
+    """Fans out messages to asyncio queues; publish() may be called from any thread."""
+
+    def __init__(self, queue_size: int = EVENT_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers = {}  # queue → event loop that owns it
+        self._lock = threading.Lock()
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a new subscriber (must be called from its event loop)."""
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._subscribers[queue] = asyncio.get_running_loop()
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        with self._lock:
+            self._subscribers.pop(queue, None)
+
+    def publish(self, event: dict):
+        """Encode `event` once and queue it for every subscriber."""
+        with self._lock:
+            subscribers = list(self._subscribers.items())
+        if not subscribers:
+            return
+        message = _encode(event)
+        for queue, loop in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._deliver, queue, message)
+            except RuntimeError:  # Loop already closed
+                self.unsubscribe(queue)
+
+    @staticmethod
+    def _deliver(queue: asyncio.Queue, message: str):
+        """Runs on the subscriber's loop; a full queue is replaced by one resync message."""
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning("event subscriber fell behind; asking it to resync")
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(_encode({"op": "resync"}))
+
+
+plane_events = PlaneEventHub()
+
+
+# ---------- Helpers used by crud.py ---------- #
+
+def plane_written(op: str, plane):
+    """Publish a create/update event carrying the full (small) plane row."""
+    plane_events.publish({
+        "op": op,
+        "v": plane.RowVersion,
+        "plane": PlaneRead.model_validate(plane).model_dump(mode="json"),
+    })
+
+
+def plane_deleted(plane_id: int, version: int):
+    """Publish a delete event."""
+    plane_events.publish({"op": "delete", "v": version, "id": plane_id})
+
+
+def planes_bulk_written(version: int):
+    """Publish a single event for a bulk write (details come from the change feed)."""
+    plane_events.publish({"op": "bulk", "v": version})
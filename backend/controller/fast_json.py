@@ -0,0 +1,40 @@
+import json
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the (slower) stdlib encoder
+    orjson = None
+
+
+# ============================================================
+# ⚡ Fast JSON — orjson encoding for the hot read paths
+# ============================================================
+# orjson encodes plain dicts/lists several times faster than the stdlib
+# encoder and returns bytes directly. Without it installed, the stdlib
+# encoder is used with the same compact output.
+
+def dumps(content) -> bytes:
+    """Encode `content` (plain JSON types) to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def encode_rows(rows) -> bytes:
+    """
+    Encode SQLAlchemy column rows as a JSON array of objects.
+    - Keys are the selected column names, in select order
+    - No per-row Pydantic model is built: the column types already match the schema
+    """
+    if not rows:
+        return b"[]"
+    keys = rows[0]._fields
+    return dumps([dict(zip(keys, row)) for row in rows])
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (when available)."""
+
+    def render(self, content) -> bytes:
+        return dumps(content)
@@ -0,0 +1,193 @@
+import os
+import bisect
+import threading
+import time
+from backend.model import query_stats
+
+
+# ============================================================
+# 📊 Metrics — request counters and histograms in Prometheus text format
+# ============================================================
+# MetricsMiddleware records, per route template (e.g. /planes/{plane_id}):
+# - requests by method and status, and the number of requests in flight
+# - latency, response size and database time histograms
+# GET /metrics renders everything with render_metrics(); the p50/p95/p99
+# latencies are estimated from the histogram buckets (like PromQL's
+# histogram_quantile), so no per-request samples are kept.
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+QUANTILES = (0.5, 0.95, 0.99)
+
+# Label used for requests that did not match any route (404s, probes, ...)
+UNMATCHED_ROUTE = "<unmatched>"
+
+# Debug mode: add X-DB-Queries / X-DB-Time (ms) headers to every response,
+# so N+1 queries and extra round trips show up in tests and in the browser.
+DEBUG_DB_HEADERS = os.getenv("API_DEBUG", "0").lower() in ("1", "true", "yes")
+
+
+class Histogram:
+    """Cumulative-bucket histogram for one label set."""
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-quantile by linear interpolation inside its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if seen + n >= rank and n:
+                if i == len(self.bounds):
+                    return self.bounds[-1]  # Above the last bound: report the bound
+                lower = self.bounds[i - 1] if i else 0.0
+                return lower + (self.bounds[i] - lower) * (rank - seen) / n
+            seen += n
+        return self.bounds[-1]
+
+
+class MetricsRegistry:
+    """All request metrics of this process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.requests = {}  # (method, route, status) → count
+        self.latency = {}   # (method, route) → Histogram
+        self.size = {}      # (method, route) → Histogram
+        self.db_time = {}   # (method, route) → Histogram
+
+    def started(self):
+        with self._lock:
+            self.in_flight += 1
+
+    def finished(self, method, route, status, seconds, size, db_seconds):
+        key = (method, route)
+        with self._lock:
+            self.in_flight -= 1
+            self.requests[key + (status,)] = self.requests.get(key + (status,), 0) + 1
+            self.latency.setdefault(key, Histogram(LATENCY_BUCKETS)).observe(seconds)
+            self.size.setdefault(key, Histogram(SIZE_BUCKETS)).observe(size)
+            self.db_time.setdefault(key, Histogram(LATENCY_BUCKETS)).observe(db_seconds)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            lines += [
+                "# HELP flysmart_http_requests_in_flight Requests currently being served.",
+                "# TYPE flysmart_http_requests_in_flight gauge",
+                f"flysmart_http_requests_in_flight {self.in_flight}",
+                "# HELP flysmart_http_requests_total Requests served, by route template and status.",
+                "# TYPE flysmart_http_requests_total counter",
+            ]
+            for (method, route, status), n in sorted(self.requests.items()):
+                lines.append(f"flysmart_http_requests_total{_labels(method=method, route=route, status=status)} {n}")
+
+            _render_histogram(lines, "flysmart_http_request_duration_seconds",
+                              "Request latency (until the last body byte was sent).", self.latency)
+            lines += [
+                "# HELP flysmart_http_request_duration_quantile_seconds Latency quantiles estimated from the histogram.",
+                "# TYPE flysmart_http_request_duration_quantile_seconds gauge",
+            ]
+            for (method, route), hist in sorted(self.latency.items()):
+                for q in QUANTILES:
+                    labels = _labels(method=method, route=route, quantile=q)
+                    lines.append(f"flysmart_http_request_duration_quantile_seconds{labels} {hist.quantile(q):.6f}")
+
+            _render_histogram(lines, "flysmart_http_response_size_bytes",
+                              "Response body size.", self.size)
+            _render_histogram(lines, "flysmart_http_request_db_seconds",
+                              "Time spent executing SQL statements per request.", self.db_time)
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _render_histogram(lines, name, help_text, histograms):
+    lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for (method, route), hist in sorted(histograms.items()):
+        cumulative = 0
+        for bound, n in zip(hist.bounds + (float("inf"),), hist.counts):
+            cumulative += n
+            le = "+Inf" if bound == float("inf") else bound
+            lines.append(f"{name}_bucket{_labels(method=method, route=route, le=le)} {cumulative}")
+        lines.append(f"{name}_sum{_labels(method=method, route=route)} {hist.sum:.6f}")
+        lines.append(f"{name}_count{_labels(method=method, route=route)} {hist.count}")
+
+
+registry = MetricsRegistry()
+
+
+def render_metrics() -> str:
+    return registry.render()
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware (streamed bodies are measured until their last chunk).
+    - The route template is read from the matched route after the app ran,
+      so /planes/1 and /planes/2 share the label /planes/{plane_id}
+    - With API_DEBUG=1 the SQL statement count and time are sent as headers
+      (for streamed bodies they cover the statements run before the first chunk)
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        stats = query_stats.begin_request()
+        registry.started()
+        status = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if DEBUG_DB_HEADERS:
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"x-db-queries", str(stats.count).encode()),
+                        (b"x-db-time", f"{stats.seconds * 1000:.2f}".encode()),
+                    ]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            registry.finished(
+                scope["method"],
+                getattr(route, "path", UNMATCHED_ROUTE),
+                status,
+                time.perf_counter() - started,
+                size,
+                stats.seconds,
+            )
+            query_stats.end_request()
@@ -0,0 +1,111 @@
+import os
+import threading
+from collections import OrderedDict
+from fastapi import Response
+from backend.controller.fast_json import dumps, encode_rows
+from backend.model.schemas import PlaneRead
+
+
+# ============================================================
+# 🗃️ Response cache — pre-serialized JSON bodies for plane reads
+# ============================================================
+# GET /planes, /planes/search and /planes/{id} are answered from encoded
+# bytes kept in memory, so a hit skips the query and the JSON encoding.
+# - Keys embed the Planes table version, so an entry can never outlive the
+#   data it was built from (also across several API processes)
+# - crud.py clears the cache on every write, freeing memory right away
+# - Eviction is LRU, bounded by entry count and total body size
+
+# Maximum number of cached responses
+CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "256"))
+
+# Maximum total size of the cached bodies, in bytes (0 disables the cache)
+CACHE_MAX_BYTES = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+
+def encode_planes(rows) -> bytes:
+    """Serialize PlaneRead column rows (crud.get_plane_rows) to a GET /planes body."""
+    return encode_rows(rows)
+
+
+def encode_plane(plane, fields=None) -> bytes:
+    """Serialize one Plane row (or only its projected `fields`) to a GET /planes/{id} body."""
+    if fields:
+        return dumps({field: getattr(plane, field) for field in fields})
+    return dumps(PlaneRead.model_validate(plane).model_dump(mode="json"))
+
+
+def item_key(plane_id: int, table_version: int, fields=None) -> str:
+    """Cache key of a single plane (and field projection) at the given table version."""
+    key = f"plane-{plane_id}@{table_version}"
+    return f"{key}?fields={','.join(fields)}" if fields else key
+
+
+class ResponseCache:
+    """Thread-safe LRU of (body, headers) pairs with hit/miss counters."""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES, max_bytes: int = CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key → (body, headers)
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: str):
+        """Return a ready Response for `key`, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        body, headers = entry
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    def put(self, key: str, body: bytes, headers: dict) -> Response:
+        """Store an encoded body with its headers and return it as a Response."""
+        headers = dict(headers)
+        if 0 < len(body) <= self.max_bytes:
+            with self._lock:
+                old = self._entries.pop(key, None)
+                if old is not None:
+                    self._size -= len(old[0])
+                self._entries[key] = (body, headers)
+                self._size += len(body)
+                while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                    _, (evicted, _) = self._entries.popitem(last=False)
+                    self._size -= len(evicted)
+                    self.evictions += 1
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    def clear(self):
+        """Drop every entry (called after writes to the Planes table)."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        """Counters and current size, used to tune the bounds."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+# Shared by the sync and async routers
+plane_cache = ResponseCache()
@@ -1,48 +1,477 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from backend.model.db import get_db
-from backend.controller import crud
-from backend.model.schemas import PlaneCreate, PlaneUpdate, PlaneRead, PlaneDeleteResponse
-from typing import List
+from backend.model.db import get_db, SessionLocal
+from backend.controller.fast_json import FastJSONResponse
+from backend.controller import blobs, crud, etags, thumbnails
+from backend.controller.response_cache import plane_cache, encode_plane, encode_planes, item_key
+from backend.model.schemas import (
+    PlaneCreate, PlaneUpdate, PlanePatch, PlaneRead, PlaneDeleteResponse, PlaneStats, PlaneChanges,
+    PlaneBulkUpdate, PlaneBulkDelete, PlaneBulkResponse,
+)
+from typing import List, Optional
 
 
 # ============================================================
 # 🛫 Planes Router — defines all API endpoints for plane data
 # ============================================================
 
-# The router groups all /planes-related routes under one prefix
-plane_router = APIRouter(prefix="/planes", tags=["Planes"])
+# The router groups all /planes-related routes under one prefix.
+# Model responses are rendered with orjson (see fast_json.py).
+plane_router = APIRouter(prefix="/planes", tags=["Planes"], default_response_class=FastJSONResponse)
 
+# Uploaded pictures (see blobs.py), referenced by Plane.Picture
+blob_router = APIRouter(prefix="/blobs", tags=["Blobs"])
 
+# Routes defined with @shared_route are also served by async handlers when
+# DB_ASYNC=1: async_routers.py builds its router from this same list, so each
+# route has exactly one definition. Entries: (method, path, handler, options)
+SHARED_ROUTES = []
+
+
+def shared_route(method: str, path: str, **options):
+    """Register a handler on plane_router and list it for the async router."""
+    def register(handler):
+        getattr(plane_router, method)(path, **options)(handler)
+        SHARED_ROUTES.append((method, path, handler, options))
+        return handler
+    return register
+
+
+# Read endpoints answer `If-None-Match` with 304 Not Modified
+NOT_MODIFIED = {304: {"description": "Not modified (ETag matched If-None-Match)"}}
+
+FIELDS_DESCRIPTION = (
+    "Comma-separated fields to return, e.g. PlaneId,Name,Year "
+    f"(any of {', '.join(crud.PROJECTABLE_FIELDS)}; PlaneId is always included)"
+)
+
+
+def parse_fields(fields: Optional[str]):
+    """
+    Turn a `?fields=` value into a tuple of field names (None → all fields).
+    - PlaneId is always included (first), duplicates are dropped
+    - Unknown names are rejected with 422
+    """
+    if not fields:
+        return None
+    names = ["PlaneId"] + [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in names if f not in crud.PROJECTABLE_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown field(s): {', '.join(unknown)}. Allowed: {', '.join(crud.PROJECTABLE_FIELDS)}",
+        )
+    return tuple(dict.fromkeys(names))
+
+
+# ------------------------------------------------------------
+# GET /planes — Retrieve planes (optionally one page at a time)
+# ------------------------------------------------------------
+@shared_route("get", "/", response_model=List[PlaneRead], responses=NOT_MODIFIED)
+def read_planes(
+    request: Request,
+    after: Optional[int] = Query(None, description="Return planes with PlaneId greater than this cursor"),
+    limit: Optional[int] = Query(None, ge=1, le=crud.MAX_PAGE_SIZE, description="Maximum planes per page"),
+    with_total: bool = Query(False, description="Add an X-Total-Count header (cached count)"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: Session = Depends(get_db),
+):
+    """
+    Fetch planes from the database.
+    - Without `after`/`limit` the whole table is returned (original behavior).
+    - With them, keyset pagination is used: pass the `X-Next-After` header
+      of the previous response as `after` to get the next page.
+    - `with_total=true` adds the cached total row count as `X-Total-Count`.
+    - Carries an ETag; a matching `If-None-Match` returns 304 without a body.
+    - Rows are read as column tuples and encoded without per-row Pydantic
+      models; encoded bodies are cached per ETag (see response_cache.py).
+    - `fields` selects only the listed columns (e.g. `PlaneId,Name,Year`).
+    """
+    etag = etags.list_etag(request, crud.get_table_version(db))
+    if etags.etag_matches(request, etag):
+        return etags.not_modified(etag)
+    cached = plane_cache.get(etag)
+    if cached is not None:
+        return cached
+
+    projection = parse_fields(fields)
+    headers = etags.etag_headers(etag)
+    if with_total:
+        headers["X-Total-Count"] = str(crud.count_planes(db))
+
+    # Fast path: PlaneRead columns as tuples, encoded straight to JSON bytes
+    if after is None and limit is None:
+        rows = crud.get_plane_rows(db, fields=projection)
+    else:
+        page_size = limit or crud.DEFAULT_PAGE_SIZE
+        rows = crud.get_plane_rows(db, after=after, limit=page_size, fields=projection)
+        if len(rows) == page_size:
+            headers["X-Next-After"] = str(rows[-1].PlaneId)
+    return plane_cache.put(etag, encode_planes(rows), headers)
+
+
+# ------------------------------------------------------------
+# GET /planes/search — Filtered search (compiled into SQL)
+# ------------------------------------------------------------
+# Declared before /{plane_id} so "search" is not parsed as an ID.
+@shared_route("get", "/search", response_model=List[PlaneRead], responses=NOT_MODIFIED)
+def search_planes(
+    request: Request,
+    q: Optional[str] = Query(None, description="Substring of Name or MadeBy"),
+    made_by: Optional[List[str]] = Query(None, description="Manufacturer (repeatable)"),
+    year: Optional[List[int]] = Query(None, description="Year of manufacture (repeatable)"),
+    after: Optional[int] = Query(None, description="Return planes with PlaneId greater than this cursor"),
+    limit: int = Query(crud.DEFAULT_PAGE_SIZE, ge=1, le=crud.MAX_PAGE_SIZE, description="Maximum planes per page"),
+    with_total: bool = Query(False, description="Add an X-Total-Count header (cached count)"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: Session = Depends(get_db),
+):
+    """
+    Search planes by text, manufacturer and year.
+    - All filters are optional and combined with AND.
+    - Paginated the same way as GET /planes (`after` + `X-Next-After`).
+    - Supports ETag / If-None-Match and the response cache like GET /planes.
+    """
+    etag = etags.list_etag(request, crud.get_table_version(db))
+    if etags.etag_matches(request, etag):
+        return etags.not_modified(etag)
+    cached = plane_cache.get(etag)
+    if cached is not None:
+        return cached
+
+    projection = parse_fields(fields)
+    headers = etags.etag_headers(etag)
+    q = q.strip() if q else None
+    if with_total:
+        headers["X-Total-Count"] = str(crud.count_planes(db, q, made_by, year))
+
+    rows = crud.get_plane_rows(db, q, made_by, year, after=after, limit=limit, fields=projection)
+    if len(rows) == limit:
+        headers["X-Next-After"] = str(rows[-1].PlaneId)
+    return plane_cache.put(etag, encode_planes(rows), headers)
+
+
+# ------------------------------------------------------------
+# GET /planes/stream — Stream all matching planes as NDJSON
+# ------------------------------------------------------------
+# Number of NDJSON lines sent per chunk (small, so the first cards arrive fast)
+STREAM_CHUNK_ROWS = 50
+
+
+@plane_router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}, "description": "One PlaneRead object per line"}},
+)
+def stream_planes(
+    q: Optional[str] = Query(None, description="Substring of Name or MadeBy"),
+    made_by: Optional[List[str]] = Query(None, description="Manufacturer (repeatable)"),
+    year: Optional[List[int]] = Query(None, description="Year of manufacture (repeatable)"),
+):
+    """
+    Stream planes as newline-delimited JSON (one PlaneRead per line).
+    - Rows come from a server-side cursor and are sent as they are read,
+      so neither side holds the whole fleet in memory.
+    - Accepts the same filters as GET /planes/search.
+    """
+    q = q.strip() if q else None
+
+    def generate():
+        # The session is owned by the generator: dependencies are closed
+        # before a streaming body is sent, so get_db cannot be used here.
+        db = SessionLocal()
+        try:
+            chunk = []
+            for plane in crud.stream_planes(db, q, made_by, year):
+                chunk.append(PlaneRead.model_validate(plane).model_dump_json())
+                if len(chunk) >= STREAM_CHUNK_ROWS:
+                    yield "\n".join(chunk) + "\n"
+                    chunk = []
+            if chunk:
+                yield "\n".join(chunk) + "\n"
+        finally:
+            db.close()
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+# ------------------------------------------------------------
+# GET /planes/stats — Aggregated statistics (GROUP BY in SQL)
+# ------------------------------------------------------------
+@shared_route("get", "/stats", response_model=PlaneStats, responses=NOT_MODIFIED)
+def read_plane_stats(
+    request: Request,
+    response: Response,
+    q: Optional[str] = Query(None, description="Substring of Name or MadeBy"),
+    made_by: Optional[List[str]] = Query(None, description="Manufacturer (repeatable)"),
+    year: Optional[List[int]] = Query(None, description="Year of manufacture (repeatable)"),
+    year_bucket: int = Query(1, ge=1, le=100, description="Width of each year bucket, in years"),
+    db: Session = Depends(get_db),
+):
+    """
+    Return per-manufacturer counts, per-year counts and seat totals per class.
+    - Accepts the same filters as GET /planes/search.
+    - One small response instead of downloading the whole fleet.
+    - Supports ETag / If-None-Match like GET /planes.
+    """
+    etag = etags.list_etag(request, crud.get_table_version(db))
+    if etags.etag_matches(request, etag):
+        return etags.not_modified(etag)
+    etags.set_etag(response, etag)
+
+    q = q.strip() if q else None
+    return crud.get_plane_stats(db, q, made_by, year, year_bucket=year_bucket)
+
+
+# ------------------------------------------------------------
+# GET /planes/changes — Incremental sync (change feed)
+# ------------------------------------------------------------
+# Declared before /{plane_id} so "changes" is not parsed as an ID.
+@shared_route("get", "/changes", response_model=PlaneChanges)
+def read_plane_changes(
+    since: Optional[int] = Query(None, ge=0, description="Last version seen by the client"),
+    db: Session = Depends(get_db),
+):
+    """
+    Return the planes inserted or updated and the IDs deleted after `since`.
+    - Pass the returned `version` as `since` on the next call.
+    - Without `since` only the current version is returned.
+    - The cost is proportional to the number of changes, not to the fleet size.
+    """
+    return crud.get_changes(db, since)
+
+
+# ------------------------------------------------------------
+# GET /planes/thumbnail — Resized picture, addressed by the picture itself
 # ------------------------------------------------------------
-# GET /planes — Retrieve all planes
+# Declared before /{plane_id} so "thumbnail" is not parsed as an ID.
+@plane_router.get(
+    "/thumbnail",
+    response_class=FileResponse,
+    responses={200: {"content": {"image/jpeg": {}}}, **NOT_MODIFIED},
+)
+def read_picture_thumbnail(
+    request: Request,
+    picture: str = Query(..., min_length=1, description="Picture value of a plane, as stored"),
+    w: int = Query(260, ge=16, le=thumbnails.THUMBNAIL_MAX_SIZE, description="Maximum width in pixels"),
+    h: int = Query(150, ge=16, le=thumbnails.THUMBNAIL_MAX_SIZE, description="Maximum height in pixels"),
+    db: Session = Depends(get_db),
+):
+    """
+    Return a plane picture fitted into w x h as a JPEG.
+    - The URL depends only on the picture and the size: planes sharing a
+      picture share one URL, so clients download and cache it once
+    - The URL changes whenever the picture does, so it is cacheable for a year
+    - Only pictures used by a plane are converted (404 otherwise)
+    """
+    key = thumbnails.source_key(picture)
+    etag = f'"{key[:16]}-{w}x{h}"'
+    headers = {"ETag": etag, "Cache-Control": thumbnails.IMMUTABLE_CACHE_CONTROL}
+    if etags.etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    if not thumbnails.thumbnail_exists(picture, w, h) and not crud.picture_in_use(db, picture):
+        raise HTTPException(status_code=404, detail="No plane has this picture")
+    db.close()  # The fetch/resize below can be slow; give the connection back first
+
+    path = thumbnails.get_thumbnail(picture, w, h, str(request.base_url))
+    return FileResponse(path, media_type="image/jpeg", headers=headers)
+
+
+# ------------------------------------------------------------
+# /planes/bulk — Bulk create / update / delete
 # ------------------------------------------------------------
-@plane_router.get("/", response_model=List[PlaneRead])
-def read_planes(db: Session = Depends(get_db)):
+# Declared before /{plane_id} so "bulk" is not parsed as an ID.
+def check_batch_size(size: int):
+    """Reject batches above the configured maximum."""
+    if size > crud.MAX_BULK_ROWS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many rows in one request (max {crud.MAX_BULK_ROWS})",
+        )
+
+
+@shared_route("post", "/bulk", response_model=PlaneBulkResponse)
+def bulk_create_planes(planes: List[PlaneCreate], db: Session = Depends(get_db)):
+    """
+    Create many planes in a single transaction.
+    - The whole batch is validated first; invalid rows are reported with
+      their index (422) and nothing is written.
+    - Returns the new IDs in request order.
+    """
+    check_batch_size(len(planes))
+    return crud.bulk_create_planes(db, planes)
+
+
+@shared_route("put", "/bulk", response_model=PlaneBulkResponse)
+def bulk_update_planes(planes: List[PlaneBulkUpdate], db: Session = Depends(get_db)):
     """
-    Fetch all planes from the database.
-    - Uses a SQLAlchemy session provided by `get_db`.
-    - Calls the CRUD layer to handle the query logic.
+    Update many planes in a single transaction.
+    - Each row is a full PlaneUpdate plus its PlaneId.
+    - Unknown IDs are listed in `errors`; the other rows are still written.
     """
-    return crud.get_all_planes(db)
+    check_batch_size(len(planes))
+    return crud.bulk_update_planes(db, planes)
+
+
+@shared_route("delete", "/bulk", response_model=PlaneBulkResponse)
+def bulk_delete_planes(request: PlaneBulkDelete, db: Session = Depends(get_db)):
+    """
+    Delete many planes in a single transaction.
+    - Unknown IDs are listed in `errors`; the other planes are still deleted.
+    """
+    check_batch_size(len(request.PlaneIds))
+    return crud.bulk_delete_planes(db, request.PlaneIds)
 
 
 # ------------------------------------------------------------
 # GET /planes/{plane_id} — Retrieve a single plane by ID
 # ------------------------------------------------------------
-@plane_router.get("/{plane_id}", response_model=PlaneRead)
-def read_plane(plane_id: int, db: Session = Depends(get_db)):
+@shared_route("get", "/{plane_id}", response_model=PlaneRead, responses=NOT_MODIFIED)
+def read_plane(
+    plane_id: int,
+    request: Request,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: Session = Depends(get_db),
+):
     """
     Fetch a single plane based on its unique ID.
     Returns a PlaneRead schema object or raises an error if not found.
+    `fields` limits the loaded columns and the returned keys.
+    The ETag is derived from the row version; a matching `If-None-Match` returns 304.
+    The encoded body is cached until the next write to the Planes table.
     """
-    return crud.get_plane_by_id(db, plane_id)
+    projection = parse_fields(fields)
+    key = item_key(plane_id, crud.get_table_version(db), projection)
+    cached = plane_cache.get(key)
+    if cached is not None:
+        etag = cached.headers["ETag"]
+        return etags.not_modified(etag) if etags.etag_matches(request, etag) else cached
+
+    plane = crud.get_plane_by_id(db, plane_id, projection)
+    if not plane:
+        raise HTTPException(status_code=404, detail="Plane not found")
+
+    etag = etags.item_etag(plane, projection)
+    if etags.etag_matches(request, etag):
+        return etags.not_modified(etag)
+    return plane_cache.put(key, encode_plane(plane, projection), etags.etag_headers(etag))
+
+
+# ------------------------------------------------------------
+# GET /planes/{plane_id}/thumbnail — Resized picture (cached on disk)
+# ------------------------------------------------------------
+@plane_router.get(
+    "/{plane_id}/thumbnail",
+    response_class=FileResponse,
+    responses={200: {"content": {"image/jpeg": {}}}, **NOT_MODIFIED},
+)
+def read_plane_thumbnail(
+    plane_id: int,
+    request: Request,
+    w: int = Query(260, ge=16, le=thumbnails.THUMBNAIL_MAX_SIZE, description="Maximum width in pixels"),
+    h: int = Query(150, ge=16, le=thumbnails.THUMBNAIL_MAX_SIZE, description="Maximum height in pixels"),
+    v: Optional[str] = Query(None, description="Source version (sha256 of the Picture URL) for immutable caching"),
+    db: Session = Depends(get_db),
+):
+    """
+    Return the plane's picture fitted into w x h as a JPEG.
+    - The original is fetched and resized only once; later calls read the file from disk
+    - With a `v` matching the current picture the response is cacheable for a year,
+      otherwise clients revalidate with the ETag after a few minutes
+    """
+    plane = crud.get_plane_by_id(db, plane_id, ["Picture"])
+    if not plane:
+        raise HTTPException(status_code=404, detail="Plane not found")
+    db.close()  # The fetch/resize below can be slow; give the connection back first
+
+    key = thumbnails.source_key(plane.Picture or "")
+    etag = f'"{key[:16]}-{w}x{h}"'
+    cache_control = (
+        thumbnails.IMMUTABLE_CACHE_CONTROL if v and key.startswith(v) and len(v) >= 8
+        else thumbnails.REVALIDATE_CACHE_CONTROL
+    )
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etags.etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    path = thumbnails.get_thumbnail(plane.Picture, w, h, str(request.base_url))
+    return FileResponse(path, media_type="image/jpeg", headers=headers)
+
+
+# ------------------------------------------------------------
+# POST /planes/{plane_id}/picture — Upload a picture (streamed to the blob store)
+# ------------------------------------------------------------
+PICTURE_UPLOAD_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"multipart/form-data": {"schema": {
+            "type": "object",
+            "required": ["file"],
+            "properties": {"file": {"type": "string", "format": "binary"}},
+        }}},
+    }
+}
+
+
+def _plane_exists_then_release(db: Session, plane_id: int) -> bool:
+    """Existence check that returns the connection to the pool right after."""
+    try:
+        return crud.plane_exists(db, plane_id)
+    finally:
+        db.close()
+
+
+@plane_router.post("/{plane_id}/picture", response_model=PlaneRead, openapi_extra=PICTURE_UPLOAD_BODY)
+async def upload_plane_picture(plane_id: int, request: Request, db: Session = Depends(get_db)):
+    """
+    Upload a JPEG/PNG/GIF/WebP picture for a plane (multipart field `file`).
+    - An unknown plane is rejected (404) before the body is read, so no
+      orphan blob is stored for it
+    - The body is streamed to disk chunk by chunk, never held in memory
+    - No database connection is held during the upload: the existence check
+      gives it back first, and the Picture update runs afterwards in one
+      threadpool call
+    - Identical images are stored once; Picture is set to the server-relative
+      /blobs/<name> path, so it stays valid when the API's host name changes
+    - Returns the updated plane data.
+    """
+    if not await run_in_threadpool(_plane_exists_then_release, db, plane_id):
+        raise HTTPException(status_code=404, detail="Plane not found")
+    name = await blobs.receive_upload(request)
+    picture = request.url_for("read_blob", name=name).path
+    return await run_in_threadpool(crud.patch_plane, db, plane_id, PlanePatch(Picture=picture))
+
+
+# ------------------------------------------------------------
+# GET /blobs/{name} — Uploaded picture (Range + conditional requests)
+# ------------------------------------------------------------
+@blob_router.get(
+    "/{name}",
+    name="read_blob",
+    response_class=FileResponse,
+    responses={200: {"content": {mt: {} for mt in blobs.MEDIA_TYPES.values()}}, 206: {"description": "Partial content"}, **NOT_MODIFIED},
+)
+def read_blob(name: str, request: Request):
+    """
+    Serve a stored picture by its content address (<sha256>.<ext>).
+    - Immutable: cacheable for a year, revalidated with ETag / If-Modified-Since
+    - Supports Range requests (206 Partial Content)
+    """
+    path = blobs.blob_path(name)
+    headers = {"ETag": blobs.etag(name), "Cache-Control": blobs.BLOB_CACHE_CONTROL}
+    if blobs.not_modified(request, name, path):
+        return Response(status_code=304, headers=headers)
+    media_type = blobs.MEDIA_TYPES[name.rsplit(".", 1)[1]]
+    return FileResponse(path, media_type=media_type, headers=headers)
 
 
 # ------------------------------------------------------------
 # POST /planes — Create a new plane
 # ------------------------------------------------------------
-@plane_router.post("/", response_model=PlaneRead)
+@shared_route("post", "/", response_model=PlaneRead)
 def create_plane(plane: PlaneCreate, db: Session = Depends(get_db)):
     """
     Add a new plane to the database.
@@ -55,7 +484,7 @@ def create_plane(plane: PlaneCreate, db: Session = Depends(get_db)):
 # ------------------------------------------------------------
 # PUT /planes/{plane_id} — Update existing plane
 # ------------------------------------------------------------
-@plane_router.put("/{plane_id}", response_model=PlaneRead)
+@shared_route("put", "/{plane_id}", response_model=PlaneRead)
 def update_plane(plane_id: int, plane: PlaneUpdate, db: Session = Depends(get_db)):
     """
     Update plane details based on the provided plane ID.
@@ -65,10 +494,23 @@ def update_plane(plane_id: int, plane: PlaneUpdate, db: Session = Depends(get_db
     return crud.update_plane(db, plane_id, plane)
 
 
+# ------------------------------------------------------------
+# PATCH /planes/{plane_id} — Update only the supplied fields
+# ------------------------------------------------------------
+@shared_route("patch", "/{plane_id}", response_model=PlaneRead)
+def patch_plane(plane_id: int, plane: PlanePatch, db: Session = Depends(get_db)):
+    """
+    Partially update a plane.
+    - Only the fields present in the body are written (e.g. {"NumOfSeats2": 40})
+    - Returns the updated plane data.
+    """
+    return crud.patch_plane(db, plane_id, plane)
+
+
 # ------------------------------------------------------------
 # DELETE /planes/{plane_id} — Delete a plane
 # ------------------------------------------------------------
-@plane_router.delete("/{plane_id}", response_model=PlaneDeleteResponse)
+@shared_route("delete", "/{plane_id}", response_model=PlaneDeleteResponse)
 def delete_plane(plane_id: int, db: Session = Depends(get_db)):
     """
     Delete a plane from the database by its ID.
@@ -0,0 +1,300 @@
+import os
+import socket
+import hashlib
+import logging
+import ipaddress
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urljoin, urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from fastapi import HTTPException
+from backend.controller import blobs
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# 🖼️ Thumbnails — resized plane pictures served from one local origin
+# ============================================================
+# GET /planes/thumbnail?picture=&w=&h= (or /planes/{id}/thumbnail) answers
+# with a small JPEG instead of the full-size original behind Plane.Picture:
+# - The original is downloaded once and kept under originals/
+# - Each size is resized and re-encoded once in a process pool (Pillow)
+# - Files are content-addressed: sha256(source URL) + size, so a changed
+#   Picture URL never reuses an old thumbnail
+# Concurrent requests for the same file wait for one fetch/resize.
+# Picture URLs come from API clients, so every fetch (and every redirect
+# hop) is checked first: only allowed hosts with public addresses. The
+# host is resolved again when connecting, so a DNS answer changed in
+# between (DNS rebinding) could still point at an internal address: the
+# connections also check the address they actually reached before the
+# request is sent.
+
+THUMBNAIL_DIR = os.getenv("THUMBNAIL_DIR", "thumbnail_cache")
+
+# Largest width/height that may be requested
+THUMBNAIL_MAX_SIZE = int(os.getenv("THUMBNAIL_MAX_SIZE", "1024"))
+
+# Processes resizing images (CPU-bound work stays out of the API threads)
+THUMBNAIL_WORKERS = int(os.getenv("THUMBNAIL_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# Originals larger than this are rejected
+THUMBNAIL_MAX_SOURCE_BYTES = int(os.getenv("THUMBNAIL_MAX_SOURCE_BYTES", str(20 * 1024 * 1024)))
+
+THUMBNAIL_FETCH_TIMEOUT = (3, 10)
+
+# Hosts originals may be downloaded from, comma-separated ("*.example.com"
+# matches example.com and its subdomains). Empty: any host with public IPs only.
+THUMBNAIL_ALLOWED_HOSTS = [
+    h.strip().lower() for h in os.getenv("THUMBNAIL_ALLOWED_HOSTS", "").split(",") if h.strip()
+]
+
+# Redirects followed while downloading an original (each target is checked again)
+THUMBNAIL_MAX_REDIRECTS = 3
+THUMBNAIL_QUALITY = 85
+
+# Cache-Control for versioned URLs (?v= matches the source) and for the rest
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, max-age=300"
+
+_executor = None
+_executor_lock = threading.Lock()
+_key_locks = {}  # file path → lock held while it is being produced
+_key_locks_lock = threading.Lock()
+_thread_state = threading.local()  # Per-thread HTTP session for originals
+
+
+def source_key(url: str) -> str:
+    """Content address of a source picture (also accepted as the ?v= cache buster)."""
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def _thumbnail_path(key: str, width: int, height: int) -> str:
+    return os.path.join(THUMBNAIL_DIR, key[:2], f"{key}_{width}x{height}.jpg")
+
+
+def thumbnail_exists(url: str, width: int, height: int) -> bool:
+    """True if the width x height thumbnail of `url` was already produced."""
+    return os.path.exists(_thumbnail_path(source_key(url), width, height))
+
+
+def _executor_instance() -> ProcessPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=THUMBNAIL_WORKERS)
+        return _executor
+
+
+def shutdown():
+    """Stop the resize processes (called when the API shuts down)."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(cancel_futures=True)
+            _executor = None
+
+
+def _lock_for(path: str) -> threading.Lock:
+    with _key_locks_lock:
+        return _key_locks.setdefault(path, threading.Lock())
+
+
+def _release_lock(path: str):
+    with _key_locks_lock:
+        _key_locks.pop(path, None)
+
+
+def _host_allowed(host: str) -> bool:
+    """True if THUMBNAIL_ALLOWED_HOSTS is empty or lists `host`."""
+    if not THUMBNAIL_ALLOWED_HOSTS:
+        return True
+    for pattern in THUMBNAIL_ALLOWED_HOSTS:
+        if pattern.startswith("*."):
+            if host == pattern[2:] or host.endswith(pattern[1:]):
+                return True
+        elif host == pattern:
+            return True
+    return False
+
+
+def _is_public(address: str) -> bool:
+    return ipaddress.ip_address(address.split("%", 1)[0]).is_global
+
+
+class _BlockedAddress(Exception):
+    """A connection to a picture source reached a non-public address."""
+
+
+class _PublicOnlyConnection(HTTPConnection):
+    def connect(self):
+        super().connect()
+        _check_peer(self)
+
+
+class _PublicOnlyHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        super().connect()
+        _check_peer(self)
+
+
+def _check_peer(connection):
+    """Close `connection` and raise _BlockedAddress unless it reached a public address."""
+    address = connection.sock.getpeername()[0]
+    if not _is_public(address):
+        connection.close()
+        raise _BlockedAddress(f"{connection.host} connected to non-public address {address}")
+
+
+class _PublicOnlyPool(HTTPConnectionPool):
+    ConnectionCls = _PublicOnlyConnection
+
+
+class _PublicOnlyHTTPSPool(HTTPSConnectionPool):
+    ConnectionCls = _PublicOnlyHTTPSConnection
+
+
+class _PublicOnlyAdapter(HTTPAdapter):
+    """Transport adapter whose connections only talk to public addresses."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {"http": _PublicOnlyPool, "https": _PublicOnlyHTTPSPool}
+
+
+def _source_session() -> requests.Session:
+    """HTTP session of the current thread for downloading originals (Sessions are not thread-safe)."""
+    session = getattr(_thread_state, "session", None)
+    if session is None:
+        session = _thread_state.session = requests.Session()
+        session.trust_env = False  # A proxy from the environment would hide the real peer address
+        session.mount("http://", _PublicOnlyAdapter())
+        session.mount("https://", _PublicOnlyAdapter())
+    return session
+
+
+def _check_source(url: str):
+    """
+    Refuse URLs the API must not fetch (server-side request forgery).
+    - http(s) only, and only hosts allowed by THUMBNAIL_ALLOWED_HOSTS
+    - Every address the host resolves to must be public: loopback, private,
+      link-local (cloud metadata endpoints) and reserved ranges are rejected
+    """
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    if parts.scheme not in ("http", "https") or not host or not _host_allowed(host):
+        raise HTTPException(status_code=502, detail="Picture source is not allowed")
+    try:
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        addresses = {info[4][0] for info in socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)}
+    except (OSError, ValueError):
+        raise HTTPException(status_code=502, detail="Picture source is unreachable")
+    for address in addresses:
+        if not _is_public(address):
+            logger.warning("thumbnail source %s resolves to non-public address %s", url, address)
+            raise HTTPException(status_code=502, detail="Picture source is not allowed")
+
+
+def _open_source(url: str) -> requests.Response:
+    """
+    GET `url` as a stream, following redirects by hand so each hop is checked.
+    - The connection itself re-checks the address it reached (DNS rebinding)
+    """
+    for _ in range(THUMBNAIL_MAX_REDIRECTS + 1):
+        _check_source(url)
+        try:
+            r = _source_session().get(url, timeout=THUMBNAIL_FETCH_TIMEOUT, stream=True, allow_redirects=False)
+        except _BlockedAddress as e:
+            logger.warning("thumbnail source %s: %s", url, e)
+            raise HTTPException(status_code=502, detail="Picture source is not allowed")
+        if not r.is_redirect:
+            return r
+        url = urljoin(url, r.headers["Location"])
+        r.close()
+    raise HTTPException(status_code=502, detail="Picture source redirects too often")
+
+
+def _fetch_original(url: str, path: str):
+    """Download `url` to `path` (written to a temp file, then moved into place)."""
+    with _open_source(url) as r:
+        if r.status_code != 200:
+            raise HTTPException(status_code=502, detail=f"Picture source answered {r.status_code}")
+        size = 0
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            for chunk in r.iter_content(64 * 1024):
+                size += len(chunk)
+                if size > THUMBNAIL_MAX_SOURCE_BYTES:
+                    f.close()
+                    os.remove(tmp)
+                    raise HTTPException(status_code=502, detail="Picture source is too large")
+                f.write(chunk)
+    os.replace(tmp, path)
+
+
+def _resize(source: str, target: str, width: int, height: int, quality: int):
+    """
+    Runs in a worker process: fit the picture into width x height
+    (keeping the aspect ratio) and save it as a progressive JPEG.
+    """
+    from PIL import Image
+
+    with Image.open(source) as img:
+        img.draft("RGB", (width, height))  # JPEG sources decode at a reduced scale
+        img = img.convert("RGB")
+        img.thumbnail((width, height), Image.LANCZOS)
+        tmp = f"{target}.{os.getpid()}.tmp"
+        img.save(tmp, "JPEG", quality=quality, optimize=True, progressive=True)
+    os.replace(tmp, target)
+
+
+def _produce(path: str, build):
+    """Run `build()` once to create `path`, even when many requests ask at the same time."""
+    if os.path.exists(path):
+        return
+    lock = _lock_for(path)
+    try:
+        with lock:
+            if not os.path.exists(path):
+                build()
+    finally:
+        _release_lock(path)  # Also when build() fails (bad source, 4xx/5xx)
+
+
+def get_thumbnail(url: str, width: int, height: int, origin: str) -> str:
+    """
+    Return the path of the width x height thumbnail of `url`, creating it if needed.
+    - `origin` is this API's base URL: its /blobs/ URLs (absolute or
+      server-relative) are read straight from the blob store
+    - Raises 404 for other pictures that are not http(s) URLs
+    - Raises 502 when the source is not allowed, cannot be fetched or decoded
+    """
+    blob = blobs.path_for_url(url, origin) if url else None
+    if not blob and (not url or not url.lower().startswith(("http://", "https://"))):
+        raise HTTPException(status_code=404, detail="Plane has no picture URL")
+
+    key = source_key(url)
+    folder = os.path.join(THUMBNAIL_DIR, key[:2])
+    os.makedirs(os.path.join(folder, "originals"), exist_ok=True)
+    original = blob or os.path.join(folder, "originals", key)
+    thumbnail = _thumbnail_path(key, width, height)
+
+    if os.path.exists(thumbnail):
+        return thumbnail
+    try:
+        _produce(original, lambda: _fetch_original(url, original))
+        _produce(thumbnail, lambda: _executor_instance().submit(
+            _resize, original, thumbnail, width, height, THUMBNAIL_QUALITY
+        ).result())
+    except HTTPException:
+        raise
+    except requests.RequestException as e:
+        logger.warning("thumbnail source %s failed: %s", url, e)
+        raise HTTPException(status_code=502, detail="Picture source is unreachable")
+    except Exception as e:
+        logger.warning("thumbnail of %s failed: %s", url, e)
+        raise HTTPException(status_code=502, detail="Picture could not be converted")
+    return thumbnail
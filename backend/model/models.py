@@ -1,9 +1,22 @@
-from sqlalchemy import Column, Integer, String
-from sqlalchemy.orm import declarative_base
+from sqlalchemy import BigInteger, Column, Integer, String, Unicode
+from sqlalchemy.dialects.mssql import NVARCHAR
+from sqlalchemy.orm import column_property, declarative_base
 
 # Base class for all ORM models (each table in the DB will inherit from this)
 Base = declarative_base()
 
+# Searchable text columns (Name, MadeBy):
+# - A length: SQL Server cannot index NVARCHAR(MAX)
+# - An explicit case-insensitive collation, so `q` prefix searches (LIKE 'q%')
+#   ignore case on every database and can still seek the index
+SEARCH_TEXT_LENGTH = 255
+SEARCH_COLLATION_MSSQL = "SQL_Latin1_General_CP1_CI_AS"
+SearchText = (
+    Unicode(SEARCH_TEXT_LENGTH)
+    .with_variant(NVARCHAR(SEARCH_TEXT_LENGTH, collation=SEARCH_COLLATION_MSSQL), "mssql")
+    .with_variant(String(SEARCH_TEXT_LENGTH, collation="NOCASE"), "sqlite")
+)
+
 # ------- Plane Model ------- #
 class Plane(Base):
     """ORM model representing the 'Planes' table in the database."""
@@ -11,11 +24,46 @@ class Plane(Base):
     __tablename__ = "Planes"  # The name of the table in SQL Server
 
     # --- Table Columns ---
+    # Name, Year and MadeBy are indexed for server-side search (GET /planes/search).
     PlaneId = Column(Integer, primary_key=True, index=True)  # Unique identifier for each plane
-    Name = Column(String, nullable=False)                    # Plane name (required)
-    Year = Column(Integer, nullable=False)                   # Year of manufacture
-    MadeBy = Column(String, nullable=False)                   # Manufacturer (e.g., Boeing, Airbus)
+    Name = Column(SearchText, nullable=False, index=True)    # Plane name (required)
+    Year = Column(Integer, nullable=False, index=True)       # Year of manufacture
+    MadeBy = Column(SearchText, nullable=False, index=True)   # Manufacturer (e.g., Boeing, Airbus)
     Picture = Column(String, nullable=True)                   # Optional image URL or file path
     NumOfSeats1 = Column(Integer, nullable=False)             # Number of seats in first class
     NumOfSeats2 = Column(Integer, nullable=False)             # Number of seats in business class
     NumOfSeats3 = Column(Integer, nullable=False)             # Number of seats in economy class
+
+    # Value of the Planes table version when this row was last written (used for ETags)
+    RowVersion = Column(BigInteger, nullable=False, default=0, server_default="0", index=True)
+
+    # Computed in SQL, only when requested (?fields=TotalSeats) — deferred by default
+    TotalSeats = column_property(NumOfSeats1 + NumOfSeats2 + NumOfSeats3, deferred=True)
+
+
+# ------- Table Version Model ------- #
+class TableVersion(Base):
+    """ORM model for the 'TableVersions' table — one write counter per table.
+
+    Every write to a tracked table increments its counter in the same
+    transaction, so the counter changes whenever the table content does.
+    """
+
+    __tablename__ = "TableVersions"
+
+    TableName = Column(String(128), primary_key=True)          # Name of the tracked table
+    Version = Column(BigInteger, nullable=False, default=0)    # Incremented on every write
+
+
+# ------- Plane Tombstone Model ------- #
+class PlaneTombstone(Base):
+    """ORM model for the 'PlaneTombstones' table — one row per deleted plane.
+
+    Deleted rows cannot carry a RowVersion any more, so the version of the
+    delete is recorded here; GET /planes/changes reports it to clients.
+    """
+
+    __tablename__ = "PlaneTombstones"
+
+    PlaneId = Column(Integer, primary_key=True, autoincrement=False)   # ID of the deleted plane
+    RowVersion = Column(BigInteger, nullable=False, index=True)        # Table version of the delete
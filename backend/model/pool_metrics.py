@@ -0,0 +1,167 @@
+import os
+import functools
+import threading
+import time
+from contextvars import ContextVar
+from sqlalchemy import event, exc
+from sqlalchemy.pool import QueuePool
+
+# Checkouts that wait longer than this (ms) for a free connection count as slow
+POOL_SLOW_WAIT_MS = float(os.getenv("DB_POOL_SLOW_WAIT_MS", "10"))
+
+# perf_counter() at the start of the Engine.raw_connection() call in progress
+_checkout_started: ContextVar[float | None] = ContextVar("checkout_started", default=None)
+
+
+# ============================================================
+# 📈 Pool metrics — is the database slow, or is the pool exhausted?
+# ============================================================
+# - Pool events (connect/checkout/checkin/invalidate) count connection traffic
+# - The pool has no "checkout started" event, so the time spent waiting for
+#   a free connection is measured by wrapping the engine's raw_connection():
+#   it stamps its start time in a context variable and the "checkout" event
+#   (fired inside that call) records the wait. Every checkout through the
+#   engine goes through raw_connection() — Engine.connect(), Sessions,
+#   AsyncEngine and reconnects included; only engine.pool.connect() called
+#   directly is counted but not timed
+# Long waits or timeouts with every connection checked out mean the pool
+# is exhausted; short waits with slow requests mean the database is slow.
+
+class PoolMetrics:
+    """Thread-safe counters for one engine's connection pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.pings = 0
+        self.waits = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.slow_waits = 0
+        self.timeouts = 0
+
+    def attach(self, engine):
+        """
+        Listen to the pool events of an Engine and time its checkouts.
+        - For an AsyncEngine pass async_engine.sync_engine: AsyncConnection
+          checks out through sync_engine.raw_connection() as well
+        """
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "invalidate", self._on_invalidate)
+        time_checkouts(engine, self)
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        with self._lock:
+            self.checkouts += 1
+        started = _checkout_started.get()
+        if started is not None:
+            _checkout_started.set(None)  # A pre-ping retry is not a second wait
+            self.record_wait(time.perf_counter() - started)
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.checkins += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception):
+        with self._lock:
+            self.invalidations += 1
+
+    def record_ping(self):
+        with self._lock:
+            self.pings += 1
+
+    def record_wait(self, seconds: float, timed_out: bool = False):
+        """Record the time one checkout waited for a connection."""
+        with self._lock:
+            self.waits += 1
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+            if seconds * 1000 >= POOL_SLOW_WAIT_MS:
+                self.slow_waits += 1
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self, pool) -> dict:
+        """Current pool occupancy plus the cumulative counters."""
+        stats = {"pool": type(pool).__name__}
+        if isinstance(pool, QueuePool):
+            stats.update({
+                "size": pool.size(),
+                "max_overflow": pool._max_overflow,
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+            })
+        with self._lock:
+            waits = self.waits
+            stats.update({
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "pings": self.pings,
+                "wait_avg_ms": round(self.wait_total / waits * 1000, 3) if waits else 0.0,
+                "wait_max_ms": round(self.wait_max * 1000, 3),
+                "slow_waits": self.slow_waits,
+                "timeouts": self.timeouts,
+            })
+        return stats
+
+
+def time_checkouts(engine, metrics: PoolMetrics):
+    """
+    Wrap engine.raw_connection() so each checkout stamps the moment it starts waiting.
+    - Engine.connect() checks out through raw_connection(), so it is timed too
+    - The "checkout" listener turns the stamp into a wait time
+    - A pool TimeoutError never reaches "checkout", so it is recorded here
+    """
+    connect = engine.raw_connection
+
+    @functools.wraps(connect)
+    def timed_connect(*args, **kwargs):
+        started = time.perf_counter()
+        token = _checkout_started.set(started)
+        try:
+            return connect(*args, **kwargs)
+        except exc.TimeoutError:
+            metrics.record_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        finally:
+            _checkout_started.reset(token)
+
+    engine.raw_connection = timed_connect
+
+
+def install_idle_ping(pool_owner, idle_seconds: float, metrics: PoolMetrics | None = None):
+    """
+    Ping a connection on checkout only if it sat idle for more than `idle_seconds`.
+    - A failed ping raises DisconnectionError, so the pool replaces the
+      connection and retries the checkout
+    - Busy connections skip the extra SELECT 1 round trip
+    """
+    @event.listens_for(pool_owner, "checkin")
+    def _mark_idle(dbapi_connection, connection_record):
+        connection_record.info["idle_since"] = time.monotonic()
+
+    @event.listens_for(pool_owner, "checkout")
+    def _ping_if_idle(dbapi_connection, connection_record, connection_proxy):
+        idle_since = connection_record.info.get("idle_since")
+        if idle_since is None or time.monotonic() - idle_since < idle_seconds:
+            return
+        if metrics is not None:
+            metrics.record_ping()
+        try:
+            cursor = dbapi_connection.cursor()
+            cursor.execute("SELECT 1")
+            cursor.close()
+        except Exception as e:
+            raise exc.DisconnectionError() from e
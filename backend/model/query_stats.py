@@ -0,0 +1,91 @@
+import os
+import time
+import logging
+from contextvars import ContextVar
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+# Statements slower than this (ms) are logged with their parameters
+SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "200"))
+
+# Longest parameter repr written to the slow-query log (executemany can be huge)
+SLOW_QUERY_PARAMS_MAX_CHARS = 1000
+
+
+# ============================================================
+# ⏱️ Query stats — SQL statements and time spent per request
+# ============================================================
+# Cursor events time every statement and add it to the stats object of
+# the current request. The object lives in a ContextVar: FastAPI copies
+# the context into the threadpool for sync handlers, so statements run
+# there (or through AsyncSession.run_sync) are attributed correctly.
+# - Every statement is logged at DEBUG level with its duration
+# - Statements above DB_SLOW_QUERY_MS are logged as warnings with parameters
+
+class QueryStats:
+    """Number of statements executed and total time spent in them."""
+
+    __slots__ = ("count", "seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+
+_current = ContextVar("query_stats", default=None)
+
+
+def begin_request() -> QueryStats:
+    """Start collecting statements for the current request (returns its stats)."""
+    stats = QueryStats()
+    _current.set(stats)
+    return stats
+
+
+def end_request():
+    """Stop collecting statements for the current request."""
+    _current.set(None)
+
+
+def current() -> QueryStats | None:
+    """Stats of the request being served, or None outside a request."""
+    return _current.get()
+
+
+def install(engine):
+    """Time every statement executed through `engine` (a sync Engine)."""
+
+    # The start time lives on the statement's ExecutionContext, so a failed
+    # statement (no after_cursor_execute) leaves nothing behind.
+    # Context-less cursor calls (e.g. pre-executed sequences) are not timed.
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._query_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_query_start", None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+        stats = _current.get()
+        if stats is not None:
+            stats.count += 1
+            stats.seconds += elapsed
+
+        elapsed_ms = elapsed * 1000
+        if elapsed_ms >= SLOW_QUERY_MS:
+            params = repr(parameters)
+            if len(params) > SLOW_QUERY_PARAMS_MAX_CHARS:
+                params = params[:SLOW_QUERY_PARAMS_MAX_CHARS] + "..."
+            logger.warning("slow query (%.1f ms): %s | params: %s", elapsed_ms, _one_line(statement), params)
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug("query (%.1f ms): %s", elapsed_ms, _one_line(statement))
+
+
+def _one_line(statement: str) -> str:
+    """Collapse a compiled statement's line breaks and indentation for the log."""
+    return " ".join(statement.split())
@@ -1,4 +1,5 @@
-from pydantic import BaseModel
+from typing import List, Optional
+from pydantic import BaseModel, field_validator
 
 # ------- Plane-related Schemas ------- #
 # These classes define how plane data is validated and structured
@@ -25,6 +26,28 @@ class PlaneUpdate(PlaneBase):
     pass
 
 
+class PlanePatch(BaseModel):
+    """
+    Schema for PATCH /planes/{id} — every field is optional.
+    - Only the fields present in the body are written (model_dump(exclude_unset=True))
+    - Picture may be set to null; the other columns may not
+    """
+    Name: Optional[str] = None
+    Year: Optional[int] = None
+    MadeBy: Optional[str] = None
+    Picture: Optional[str] = None
+    NumOfSeats1: Optional[int] = None
+    NumOfSeats2: Optional[int] = None
+    NumOfSeats3: Optional[int] = None
+
+    @field_validator("Name", "Year", "MadeBy", "NumOfSeats1", "NumOfSeats2", "NumOfSeats3")
+    @classmethod
+    def not_null(cls, value):
+        if value is None:
+            raise ValueError("may be omitted but not null")
+        return value
+
+
 class PlaneRead(PlaneBase):
     """Schema used for reading plane data from the database (includes ID)."""
     PlaneId: int
@@ -38,3 +61,70 @@ class PlaneDeleteResponse(BaseModel):
     """Schema for a successful delete response, includes deleted plane info."""
     detail: str
     deleted_plane: PlaneRead
+
+
+# ------- Bulk Operation Schemas ------- #
+
+class PlaneBulkUpdate(PlaneUpdate):
+    """Schema for one row of a bulk update (PlaneUpdate plus the target ID)."""
+    PlaneId: int
+
+
+class PlaneBulkDelete(BaseModel):
+    """Schema for a bulk delete request — the IDs of the planes to remove."""
+    PlaneIds: List[int]
+
+
+class BulkRowError(BaseModel):
+    """Error for a single row of a bulk request (index refers to the request body)."""
+    index: int
+    PlaneId: int | None = None
+    errors: List[str]
+
+
+class PlaneBulkResponse(BaseModel):
+    """Schema for bulk responses: IDs of the written rows plus per-row errors."""
+    detail: str
+    processed: int
+    PlaneIds: List[int]
+    errors: List[BulkRowError] = []
+
+
+# ------- Statistics Schemas ------- #
+# Aggregates computed in the database for the statistics dialog.
+
+class ManufacturerCount(BaseModel):
+    """Number of planes built by one manufacturer."""
+    MadeBy: str
+    count: int
+
+
+class YearBucketCount(BaseModel):
+    """Number of planes in one year bucket (Year is the first year of the bucket)."""
+    Year: int
+    count: int
+
+
+class SeatTotals(BaseModel):
+    """Sum of seats per class across the selected planes."""
+    NumOfSeats1: int
+    NumOfSeats2: int
+    NumOfSeats3: int
+
+
+class PlaneStats(BaseModel):
+    """Schema for GET /planes/stats — all the data needed to draw the statistics charts."""
+    total: int
+    year_bucket: int
+    manufacturers: List[ManufacturerCount]
+    years: List[YearBucketCount]
+    seats: SeatTotals
+
+
+# ------- Change Feed Schemas ------- #
+
+class PlaneChanges(BaseModel):
+    """Schema for GET /planes/changes — rows written and IDs deleted since a version."""
+    version: int                 # Pass as `since` on the next call
+    planes: List[PlaneRead]      # Inserted or updated planes (full rows)
+    deleted: List[int]           # IDs of deleted planes
@@ -1,11 +1,39 @@
-from fastapi import FastAPI
+import os
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, WebSocket
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
-from backend.controller.routers import plane_router  # <- תייבאי לפי השם של הקובץ שלך
-from backend.model.db import ping
+from backend.controller.routers import blob_router, plane_router  # <- תייבאי לפי השם של הקובץ שלך
+from backend.controller.response_cache import plane_cache
+from backend.controller.events import plane_events
+from backend.controller import thumbnails
+from backend.controller.metrics import MetricsMiddleware, render_metrics
+from backend.controller.compression import SelectiveGZipMiddleware
+from backend.model.db import ping, pool_status, ensure_schema, ASYNC_ENABLED, async_engine
 
-app = FastAPI(title="Planes Management API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Make sure new tables, columns and indexes exist before serving requests
+    ensure_schema()
+    yield
+    thumbnails.shutdown()
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
+app = FastAPI(title="Planes Management API", lifespan=lifespan)
+
+# With DB_ASYNC=1 the async handlers are registered first, so they serve the
+# routes they define; the sync router still provides the remaining ones.
+# (Hidden from the docs — the contract is identical to the sync routes.)
+if ASYNC_ENABLED:
+    from backend.controller.async_routers import async_plane_router
+    app.include_router(async_plane_router, include_in_schema=False)
 
 app.include_router(plane_router)
+app.include_router(blob_router)
 
 app.add_middleware(
     CORSMiddleware,
@@ -13,8 +41,16 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Total-Count", "X-Next-After", "X-DB-Queries", "X-DB-Time"],
 )
 
+# Compress responses above GZIP_MIN_SIZE bytes (small ones are not worth the CPU);
+# streams are left alone (see compression.py)
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=int(os.getenv("GZIP_MIN_SIZE", "1024")))
+
+# Added last, so it is the outermost middleware and times the whole request
+app.add_middleware(MetricsMiddleware)
+
 @app.get("/health")
 def health():
     return {"status": "ok"}
@@ -22,3 +58,53 @@ def health():
 @app.get("/db/ping")
 def db_ping():
     return {"db": "ok" if ping() else "fail"}
+
+@app.get("/db/pool")
+def db_pool():
+    """
+    Connection pool occupancy and checkout wait times.
+    - Waits/timeouts with all connections checked out → pool exhausted
+    - Short waits but slow requests → the database itself is slow
+    """
+    return pool_status()
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """Request counts, latency/size/DB-time histograms in Prometheus text format."""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+@app.get("/cache/stats")
+def cache_stats():
+    """Hit/miss counters and size of the plane response cache."""
+    return plane_cache.stats()
+
+
+# ------------------------------------------------------------
+# WS /planes/ws — Push plane change events to connected GUIs
+# ------------------------------------------------------------
+@app.websocket("/planes/ws")
+async def planes_ws(websocket: WebSocket):
+    """
+    Send one compact JSON message per committed write (see events.py).
+    - Messages from the client are ignored; reading them only detects disconnects
+    """
+    await websocket.accept()
+    queue = plane_events.subscribe()
+
+    async def send_events():
+        while True:
+            await websocket.send_text(await queue.get())
+
+    async def wait_for_disconnect():
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+
+    tasks = [asyncio.create_task(send_events()), asyncio.create_task(wait_for_disconnect())]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            task.exception()  # A failed send only means the client went away
+    finally:
+        for task in tasks:
+            task.cancel()
+        plane_events.unsubscribe(queue)
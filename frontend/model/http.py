@@ -1,5 +1,7 @@
 # frontend/model/http.py
 import os, requests
+from collections import OrderedDict
+from urllib.parse import urlencode, urljoin
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
@@ -13,21 +15,125 @@ API_BASE = os.getenv("FLYSMART_API", "http://127.0.0.1:8000")
 # Endpoint for plane-related API calls
 PLANES_URL = f"{API_BASE}/planes"
 
+# WebSocket that pushes plane change events (ws:// or wss:// matching API_BASE)
+EVENTS_URL = "ws" + PLANES_URL[len("http"):] + "/ws"
+
+# Set FLYSMART_LIVE_UPDATES=0 to disable the live change listener
+LIVE_UPDATES = os.getenv("FLYSMART_LIVE_UPDATES", "1").lower() in ("1", "true", "yes")
+
+# How the GUI draws the plane grid:
+# - "widgets" → one PlaneCard widget per plane (default)
+# - "virtual" → a QListView with a painted delegate; only visible cards cost memory/paint time
+GRID_MODE = os.getenv("FLYSMART_GRID", "widgets").lower()
+
+# Images downloaded at the same time (shared thread pool and connection pool)
+IMAGE_THREADS = int(os.getenv("FLYSMART_IMAGE_THREADS", "6"))
+
+# Image cache budgets: decoded images in RAM, downloaded bytes on disk (kept across restarts)
+IMAGE_MEMORY_BYTES = int(os.getenv("FLYSMART_IMAGE_MEMORY_MB", "64")) * 1024 * 1024
+IMAGE_DISK_BYTES = int(os.getenv("FLYSMART_IMAGE_DISK_MB", "256")) * 1024 * 1024
+IMAGE_CACHE_DIR = os.getenv(
+    "FLYSMART_IMAGE_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "flysmart", "images")
+)
+
+# Hidden plane cards kept for reuse when a filter brings their plane back (widget grid)
+CARD_POOL_SIZE = int(os.getenv("FLYSMART_CARD_POOL", "120"))
+
+# Cards load pre-sized thumbnails from the API instead of the original pictures
+# (set FLYSMART_THUMBNAILS=0 to download the originals directly)
+THUMBNAILS = os.getenv("FLYSMART_THUMBNAILS", "1").lower() in ("1", "true", "yes")
+
 # Default timeout for HTTP requests: (connect_timeout, read_timeout)
 DEFAULT_TIMEOUT = (3, 7)
 
+# Number of planes requested per page when scrolling through the fleet
+PAGE_SIZE = int(os.getenv("FLYSMART_PAGE_SIZE", "60"))
+
+# How the GUI loads the fleet:
+# - "paged"  → fetch pages on demand while scrolling (default)
+# - "stream" → stream the whole (filtered) fleet as NDJSON and render progressively
+LOAD_MODE = os.getenv("FLYSMART_LOAD_MODE", "paged").lower()
+
 # ------------------------------------------------------------
 # Session with retry logic
 # ------------------------------------------------------------
-# Create a persistent HTTP session to reuse connections efficiently.
-session = requests.Session()
-
 # Define retry strategy for transient network errors.
 # - total=3 → retry up to 3 times
 # - backoff_factor=0.3 → exponential backoff between retries
 # - status_forcelist → only retry for specific HTTP errors
 retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
 
-# Mount the retry strategy for both HTTP and HTTPS requests.
-session.mount("http://", HTTPAdapter(max_retries=retry))
-session.mount("https://", HTTPAdapter(max_retries=retry))
+
+def new_session():
+    """A requests.Session with the retry strategy mounted for HTTP and HTTPS.
+    Sessions are not thread-safe: background threads create their own."""
+    s = requests.Session()
+    s.mount("http://", HTTPAdapter(max_retries=retry))
+    s.mount("https://", HTTPAdapter(max_retries=retry))
+    return s
+
+
+# Persistent HTTP session of the GUI thread (reuses connections efficiently)
+session = new_session()
+
+# ------------------------------------------------------------
+# Conditional GET with ETag validators
+# ------------------------------------------------------------
+# The server tags read responses with an ETag. We remember the last
+# ETag and decoded body per URL and send it back as If-None-Match;
+# a 304 answer then costs only a header round trip.
+VALIDATOR_CACHE_SIZE = 256
+_validators = OrderedDict()  # full URL → (etag, decoded JSON, response headers)
+
+
+def get_json(url, params=None, timeout=DEFAULT_TIMEOUT):
+    """
+    GET a JSON resource, revalidating a cached copy with If-None-Match.
+    Returns (data, headers) — from the cache when the server answers 304.
+    """
+    full_url = requests.Request("GET", url, params=params).prepare().url
+    cached = _validators.get(full_url)
+    headers = {"If-None-Match": cached[0]} if cached else {}
+
+    r = session.get(full_url, headers=headers, timeout=timeout)
+    if r.status_code == 304 and cached:
+        _validators.move_to_end(full_url)
+        return cached[1], cached[2]
+    r.raise_for_status()
+
+    data = r.json()
+    etag = r.headers.get("ETag")
+    if etag:
+        _validators[full_url] = (etag, data, dict(r.headers))
+        _validators.move_to_end(full_url)
+        while len(_validators) > VALIDATOR_CACHE_SIZE:
+            _validators.popitem(last=False)
+    return data, r.headers
+
+
+# ------------------------------------------------------------
+# Pictures & Thumbnails
+# ------------------------------------------------------------
+def picture_url(picture):
+    """
+    Downloadable URL of a Picture value.
+    Uploaded pictures are stored as server-relative paths (/blobs/<name>),
+    which are resolved against API_BASE; anything else is returned as is.
+    """
+    if picture and picture.startswith("/"):
+        return urljoin(API_BASE, picture)
+    return picture
+
+
+def thumbnail_url(picture: str, width: int, height: int) -> str:
+    """
+    URL of the server-side thumbnail of a plane picture.
+    The URL depends only on the picture and the size: planes sharing a
+    picture share one download and one cache entry, and a new Picture
+    gets a new URL (so the immutable HTTP cache entry is bypassed).
+    Local paths and THUMBNAILS=0 keep using the original picture.
+    """
+    url = picture_url(picture)
+    if not THUMBNAILS or not url.lower().startswith(("http://", "https://")):
+        return url
+    return f"{PLANES_URL}/thumbnail?{urlencode({'picture': picture, 'w': width, 'h': height})}"
@@ -1,7 +1,12 @@
 # frontend/model/plane_entity.py
+import json
 from dataclasses import dataclass
-from typing import Optional, List
-from .http import session, PLANES_URL, DEFAULT_TIMEOUT
+from typing import Optional, List, Tuple, Iterator
+from .http import session, get_json, PLANES_URL, DEFAULT_TIMEOUT, PAGE_SIZE
+
+# Fields rendered by the card grid — list requests ask the API for only these
+# (TotalSeats is computed by the server; the details dialog loads the full plane)
+CARD_FIELDS = "PlaneId,Name,Year,MadeBy,Picture,TotalSeats"
 
 
 @dataclass
@@ -18,6 +23,20 @@ class PlaneEntity:
     NumOfSeats1: int = 0
     NumOfSeats2: int = 0
     NumOfSeats3: int = 0
+    TotalSeats: Optional[int] = None  # Set when loaded with CARD_FIELDS (seat classes are then 0)
+
+    # ------------------------------------------------------------
+    @property
+    def total_seats(self) -> int:
+        """Total number of seats (server-computed for card projections)."""
+        if self.TotalSeats is not None:
+            return self.TotalSeats
+        return self.NumOfSeats1 + self.NumOfSeats2 + self.NumOfSeats3
+
+    @property
+    def is_partial(self) -> bool:
+        """True when only the card fields were loaded (use get_by_id for the rest)."""
+        return self.TotalSeats is not None
 
     # ------------------------------------------------------------
     @classmethod
@@ -36,6 +55,7 @@ class PlaneEntity:
             NumOfSeats1=int(d.get("NumOfSeats1", 0)),
             NumOfSeats2=int(d.get("NumOfSeats2", 0)),
             NumOfSeats3=int(d.get("NumOfSeats3", 0)),
+            TotalSeats=int(d["TotalSeats"]) if d.get("TotalSeats") is not None else None,
         )
 
     # ------------------------------------------------------------
@@ -59,14 +79,135 @@ class PlaneEntity:
 
     # ------------------------------------------------------------
     @staticmethod
-    def get_all() -> List["PlaneEntity"]:
+    def get_all(fields: Optional[str] = CARD_FIELDS) -> List["PlaneEntity"]:
         """
         Fetches all planes from the API.
+        Only the fields the card grid renders are requested by default;
+        pass fields=None for full planes.
         Returns a list of PlaneEntity instances.
         """
-        r = session.get(PLANES_URL, timeout=DEFAULT_TIMEOUT)
-        r.raise_for_status()
-        return [PlaneEntity.from_dict(p) for p in r.json()]
+        params = {"fields": fields} if fields else None
+        data, _ = get_json(PLANES_URL, params=params)
+        return [PlaneEntity.from_dict(p) for p in data]
+
+    @staticmethod
+    def get_page(
+        after: Optional[int] = None,
+        limit: int = PAGE_SIZE,
+        with_total: bool = False,
+        q: str = "",
+        made_by: Optional[List[str]] = None,
+        years: Optional[List[int]] = None,
+        fields: Optional[str] = CARD_FIELDS,
+    ) -> Tuple[List["PlaneEntity"], Optional[int], Optional[int]]:
+        """
+        Fetches one page of planes using the API's keyset pagination.
+        When any filter is given, the server-side search endpoint is used.
+        Like get_all, only the card fields are requested by default.
+        Returns (planes, next_after, total):
+        - next_after is the cursor for the following page, or None on the last page
+        - total is the server's (cached) plane count when with_total is True
+        """
+        params = {"limit": limit}
+        if after is not None:
+            params["after"] = after
+        if with_total:
+            params["with_total"] = "true"
+        if fields:
+            params["fields"] = fields
+
+        url = PLANES_URL
+        if q or made_by or years:
+            url = f"{PLANES_URL}/search"
+            if q:
+                params["q"] = q
+            if made_by:
+                params["made_by"] = list(made_by)
+            if years:
+                params["year"] = [int(y) for y in years]
+
+        data, headers = get_json(url, params=params)
+        planes = [PlaneEntity.from_dict(p) for p in data]
+
+        next_after = headers.get("X-Next-After")
+        total = headers.get("X-Total-Count")
+        return (
+            planes,
+            int(next_after) if next_after else None,
+            int(total) if total else None,
+        )
+
+    @staticmethod
+    def iter_stream(
+        q: str = "",
+        made_by: Optional[List[str]] = None,
+        years: Optional[List[int]] = None,
+        http_session=None,
+    ) -> Iterator["PlaneEntity"]:
+        """
+        Streams planes from the API's NDJSON endpoint.
+        Yields PlaneEntity instances as soon as each line arrives,
+        without waiting for (or buffering) the whole response body.
+        Callers on a background thread pass their own `http_session`.
+        The request asks for an uncompressed body: a gzip stream is only
+        readable once the server flushes a compressed block.
+        """
+        params = {}
+        if q:
+            params["q"] = q
+        if made_by:
+            params["made_by"] = list(made_by)
+        if years:
+            params["year"] = [int(y) for y in years]
+
+        with (http_session or session).get(
+            f"{PLANES_URL}/stream",
+            params=params,
+            headers={"Accept-Encoding": "identity"},
+            timeout=DEFAULT_TIMEOUT,
+            stream=True,
+        ) as r:
+            r.raise_for_status()
+            for line in r.iter_lines():
+                if line:
+                    yield PlaneEntity.from_dict(json.loads(line))
+
+    @staticmethod
+    def get_stats(
+        q: str = "",
+        made_by: Optional[List[str]] = None,
+        years: Optional[List[int]] = None,
+        year_bucket: int = 1,
+    ) -> dict:
+        """
+        Fetches aggregated statistics (computed by the server with GROUP BY)
+        for the planes matching the given filters.
+        Returns the /planes/stats payload as a dict.
+        """
+        params = {"year_bucket": year_bucket}
+        if q:
+            params["q"] = q
+        if made_by:
+            params["made_by"] = list(made_by)
+        if years:
+            params["year"] = [int(y) for y in years]
+
+        data, _ = get_json(f"{PLANES_URL}/stats", params=params)
+        return data
+
+    @staticmethod
+    def get_changes(
+        since: Optional[int] = None,
+    ) -> Tuple[List["PlaneEntity"], List[int], int]:
+        """
+        Fetches the planes written and the IDs deleted after version `since`.
+        Returns (planes, deleted_ids, version); pass `version` as `since` next time.
+        Without `since` only the server's current version is returned.
+        """
+        params = {"since": since} if since is not None else None
+        data, _ = get_json(f"{PLANES_URL}/changes", params=params)
+        planes = [PlaneEntity.from_dict(p) for p in data["planes"]]
+        return planes, [int(pid) for pid in data["deleted"]], int(data["version"])
 
     @staticmethod
     def get_by_id(plane_id: int) -> Optional["PlaneEntity"]:
@@ -74,9 +215,8 @@ class PlaneEntity:
         Fetches a single plane by its ID from the API.
         Returns a PlaneEntity instance or None if not found.
         """
-        r = session.get(f"{PLANES_URL}/{plane_id}", timeout=DEFAULT_TIMEOUT)
-        r.raise_for_status()
-        return PlaneEntity.from_dict(r.json())
+        data, _ = get_json(f"{PLANES_URL}/{plane_id}")
+        return PlaneEntity.from_dict(data)
 
     # ------------------------------------------------------------
     @staticmethod
@@ -101,6 +241,16 @@ class PlaneEntity:
         updated = r.json()
         return PlaneEntity.from_dict(updated)
 
+    @staticmethod
+    def patch(plane_id: int, changes: dict) -> Optional["PlaneEntity"]:
+        """
+        Updates only the given fields of a plane using PATCH request.
+        Returns a PlaneEntity representing the updated object.
+        """
+        r = session.patch(f"{PLANES_URL}/{plane_id}", json=changes, timeout=DEFAULT_TIMEOUT)
+        r.raise_for_status()
+        return PlaneEntity.from_dict(r.json())
+
     @staticmethod
     def delete(plane_id: int) -> bool:
         """
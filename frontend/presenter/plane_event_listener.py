@@ -0,0 +1,70 @@
+import json
+from PySide6.QtCore import QObject, QTimer, QUrl, Signal
+from PySide6.QtWebSockets import QWebSocket
+from ..model.http import EVENTS_URL
+
+
+class PlaneEventListener(QObject):
+    """Listens to the API's /planes/ws WebSocket for plane change events.
+
+    QWebSocket is event driven, so the listener lives on the GUI thread
+    without a worker thread. Dropped connections are retried with a
+    growing delay; `connected` is emitted on every (re)connect so the
+    presenter can catch up on events missed while disconnected.
+    """
+
+    event_received = Signal(dict)  # Decoded event, e.g. {"op": "update", "v": 12, "plane": {...}}
+    connected = Signal()
+
+    MIN_RETRY_MS = 1000
+    MAX_RETRY_MS = 30000
+
+    def __init__(self, url: str = EVENTS_URL, parent=None):
+        """Initialize the socket and the reconnect timer (call start() to connect)."""
+        super().__init__(parent)
+        self.url = url
+        self._retry_ms = self.MIN_RETRY_MS
+        self._stopped = False
+
+        self._socket = QWebSocket()
+        self._socket.setParent(self)
+        self._socket.connected.connect(self._on_connected)
+        self._socket.disconnected.connect(self._on_disconnected)
+        self._socket.textMessageReceived.connect(self._on_message)
+
+        self._retry_timer = QTimer(self)
+        self._retry_timer.setSingleShot(True)
+        self._retry_timer.timeout.connect(self._open)
+
+    def start(self):
+        """Opens the connection."""
+        self._stopped = False
+        self._open()
+
+    def stop(self):
+        """Closes the connection and stops reconnecting."""
+        self._stopped = True
+        self._retry_timer.stop()
+        self._socket.close()
+
+    def _open(self):
+        self._socket.open(QUrl(self.url))
+
+    def _on_connected(self):
+        self._retry_ms = self.MIN_RETRY_MS
+        self.connected.emit()
+
+    def _on_disconnected(self):
+        """Schedules a reconnect (also reached when a connection attempt fails)."""
+        if self._stopped:
+            return
+        self._retry_timer.start(self._retry_ms)
+        self._retry_ms = min(self._retry_ms * 2, self.MAX_RETRY_MS)
+
+    def _on_message(self, message: str):
+        try:
+            event = json.loads(message)
+        except ValueError:
+            return
+        if isinstance(event, dict):
+            self.event_received.emit(event)
@@ -1,43 +1,239 @@
+from PySide6.QtCore import QObject
 from PySide6.QtWidgets import QMessageBox
+from ..model.http import LIVE_UPDATES, LOAD_MODE
 from ..model.plane_entity import PlaneEntity
 from ..view.plane_form_dialog import PlaneFormDialog
+from .plane_event_listener import PlaneEventListener
+from .plane_stream_worker import PlaneStreamWorker
 
 
-class PlanePresenter:
-    """Presenter layer that connects the View and Model — manages all CRUD operations for planes."""
+class PlanePresenter(QObject):
+    """Presenter layer that connects the View and Model — manages all CRUD operations for planes.
+
+    It is a QObject so that signals from background workers are delivered
+    to its methods on the GUI thread.
+    """
 
     def __init__(self, view):
+        super().__init__()
         self.view = view  # Reference to the View layer (plane_view)
+        self.total_planes = None    # Total number of planes on the server (if known)
+        self._next_after = None     # Cursor of the next page (None → no more pages)
+        self._loading_page = False  # Guards against overlapping page requests
+        self._filters = {}          # Filters of the currently loaded result set
+        self._stream_worker = None  # Active NDJSON stream (LOAD_MODE == "stream")
+        self._workers = set()       # Keeps running (incl. cancelled) workers alive
+        self._version = None        # Last server version applied to the view (change feed)
+
+        # Live updates pushed by the server when other operators edit planes
+        self._listener = None
+        if LIVE_UPDATES:
+            self._listener = PlaneEventListener(parent=self)
+            self._listener.event_received.connect(self.apply_event)
+            self._listener.connected.connect(self._on_listener_connected)
+            self._listener.start()
 
     # ------------------------------------------------------------
+    def _current_filters(self):
+        """Returns the view's active filters as keyword arguments for the API."""
+        if not hasattr(self.view, "current_filters"):
+            return {}
+        search_text, makers, years = self.view.current_filters()
+        return {"q": search_text, "made_by": makers, "years": years}
+
     def load_planes(self):
-        """Fetches all planes from the server and displays them in the view."""
+        """
+        Fetches the first page of planes matching the view's filters
+        (filtering is done by the server) and displays it in the view.
+        In "stream" load mode the whole filtered fleet is streamed instead.
+        """
+        if LOAD_MODE == "stream":
+            self.stream_planes()
+            return
+
         try:
-            planes = PlaneEntity.get_all()
+            self._filters = self._current_filters()
+            self._version = PlaneEntity.get_changes()[2]  # Read before the data
+            planes, self._next_after, self.total_planes = PlaneEntity.get_page(
+                with_total=True, **self._filters
+            )
             self.view.show_planes(planes)
         except Exception as e:
             QMessageBox.critical(self.view, "Error", f"Failed to load planes:\n{e}")
 
+    # ------------------------------------------------------------
+    def has_more_planes(self):
+        """Returns True if the server still has planes that were not loaded yet."""
+        return self._next_after is not None
+
+    def load_more_planes(self):
+        """Fetches the next page of planes (if any) and appends it to the view."""
+        if not self.has_more_planes() or self._loading_page:
+            return
+        self._loading_page = True
+        try:
+            planes, self._next_after, _ = PlaneEntity.get_page(
+                after=self._next_after, **self._filters
+            )
+            self.view.append_planes(planes)
+        except Exception as e:
+            self.view.show_status(f"⚠️ Failed to load more planes: {e}")
+        finally:
+            self._loading_page = False
+
+    # ------------------------------------------------------------
+    def stream_planes(self):
+        """
+        Streams all planes matching the view's filters (NDJSON) and renders
+        them progressively — the first cards appear before the last rows arrive.
+        """
+        if self._stream_worker:
+            self._stream_worker.cancel()
+
+        self._filters = self._current_filters()
+        self._next_after = None
+        self.total_planes = None
+        try:
+            self._version = PlaneEntity.get_changes()[2]  # Read before the data
+        except Exception:
+            self._version = None  # The next sync falls back to a full reload
+        self.view.show_planes([])
+        self.view.show_status("⏳ Loading...")
+
+        worker = PlaneStreamWorker(self._filters)
+        worker.batch_ready.connect(self._on_stream_batch)
+        worker.finished.connect(self._on_stream_finished)
+        worker.failed.connect(self._on_stream_failed)
+        self._stream_worker = worker
+        self._workers.add(worker)
+        worker.start()
+
+    def _on_stream_batch(self, worker, planes):
+        """Appends a streamed batch to the view (ignores cancelled streams)."""
+        if worker is self._stream_worker:
+            self.view.append_planes(planes, immediate=True)
+
+    def _on_stream_finished(self, worker, count):
+        """Records the final plane count once the stream has been fully read."""
+        self._workers.discard(worker)
+        if worker is self._stream_worker:
+            self._stream_worker = None
+            self.total_planes = count
+            self.view.show_status(f"✅ Loaded {count} planes")
+
+    def _on_stream_failed(self, worker, message):
+        """Reports a failed stream in the status bar."""
+        self._workers.discard(worker)
+        if worker is self._stream_worker:
+            self._stream_worker = None
+            self.view.show_status(f"⚠️ Failed to load planes: {message}")
+
+    # ------------------------------------------------------------
+    def sync_changes(self):
+        """
+        Applies the server's changes since the last seen version to the view:
+        inserted and updated planes are added/refreshed, deleted ones removed.
+        The cost is proportional to the number of changes, not to the fleet size.
+        Falls back to a full reload when no version is known or a stream is running.
+        """
+        if self._version is None or self._stream_worker:
+            self.load_planes()
+            return
+
+        try:
+            planes, deleted, self._version = PlaneEntity.get_changes(self._version)
+        except Exception as e:
+            self.view.show_status(f"⚠️ Failed to sync changes: {e}")
+            return
+        self._apply_changes(planes, deleted)
+
+    def apply_event(self, event: dict):
+        """
+        Applies a change event pushed over the WebSocket.
+        An event that directly follows the last seen version is applied as is;
+        a gap (missed/reordered events), a bulk write or a resync request goes
+        through the change feed instead. Already applied versions are ignored.
+        """
+        if self._version is None or self._stream_worker:
+            return  # The running (or next) full load includes the change
+
+        version = event.get("v")
+        if version is not None and version <= self._version:
+            return
+
+        op = event.get("op")
+        if version == self._version + 1 and op in ("create", "update", "delete"):
+            self._version = version
+            if op == "delete":
+                self._apply_changes([], [event["id"]])
+            else:
+                self._apply_changes([PlaneEntity.from_dict(event["plane"])], [])
+        else:
+            self.sync_changes()
+
+    def _on_listener_connected(self):
+        """Catches up on changes made while the listener was disconnected."""
+        if self._version is not None and not self._stream_worker:
+            self.sync_changes()
+
+    def _apply_changes(self, planes, deleted):
+        """Patches the view's cards with written planes and deleted IDs."""
+        loaded = {p.PlaneId for p in getattr(self.view, "planes", [])}
+        removed = [pid for pid in deleted if pid in loaded]
+        added = 0
+        for plane in planes:
+            if plane.PlaneId in loaded:
+                if self._matches_filters(plane):
+                    self.view.refresh_plane_card(plane)
+                else:
+                    removed.append(plane.PlaneId)
+            elif self._matches_filters(plane) and not self.has_more_planes():
+                # With more pages pending, the plane arrives with a later page
+                self.view.add_plane_card(plane)
+                added += 1
+
+        for plane_id in removed:
+            self.view.remove_plane_card(plane_id)
+
+        if self.total_planes is not None:
+            self.total_planes += added - len(removed)
+
+    def _matches_filters(self, plane):
+        """Client-side mirror of the server's search filters, for synced planes
+        (case-insensitive like the server's Name/MadeBy collation)."""
+        q = (self._filters.get("q") or "").casefold()
+        if q and q not in plane.Name.casefold() and q not in plane.MadeBy.casefold():
+            return False
+        made_by = self._filters.get("made_by")
+        if made_by and plane.MadeBy.casefold() not in {m.casefold() for m in made_by}:
+            return False
+        years = self._filters.get("years")
+        if years and str(plane.Year) not in {str(y) for y in years}:
+            return False
+        return True
+
     # ------------------------------------------------------------
     def add_plane(self, data: dict):
         """Creates a new plane record and displays it in the view."""
         try:
-            plane = PlaneEntity(**data)      # Create PlaneEntity instance from the input data
-            plane.create(data)               # Send POST request to backend
-            self.view.add_plane_card(plane)  # Add the new card visually
+            PlaneEntity.create(data)  # Send POST request to backend
+            self.sync_changes()       # Add the new card (and any other changes) visually
             return True, ""
         except Exception as e:
             return False, f"Error adding plane: {e}"
 
     # ------------------------------------------------------------
     def update_plane(self, plane_id: int, data: dict):
-        """Updates an existing plane's data both in the backend and the view."""
+        """
+        Updates an existing plane's data both in the backend and the view.
+        `data` holds only the changed fields (sent as PATCH); an empty dict is a no-op.
+        """
+        if not data:
+            return True, ""
         try:
-            plane = PlaneEntity.update(plane_id, data)
+            plane = PlaneEntity.patch(plane_id, data)
             if plane:
-                # Refresh the updated card visually, if supported by the view
-                if hasattr(self.view, "refresh_plane_card"):
-                    self.view.refresh_plane_card(plane)
+                self.sync_changes()  # Refresh the updated card visually
                 return True, ""
             return False, "Failed to update plane."
         except Exception as e:
@@ -52,10 +248,7 @@ class PlanePresenter:
                 return False, "Plane not found."
 
             plane.delete(plane_id)  # Request deletion from backend
-
-            # Remove the card from the visual view if supported
-            if hasattr(self.view, "remove_plane_card"):
-                self.view.remove_plane_card(plane_id)
+            self.sync_changes()     # Remove the card from the view
 
             return True, "Plane deleted successfully."
         except Exception as e:
@@ -76,21 +269,19 @@ class PlanePresenter:
 
     # ------------------------------------------------------------
     def open_add_plane(self):
-        """Opens a dialog for adding a new plane and reloads data after successful save."""
+        """Opens a dialog for adding a new plane (the view is synced when it is saved)."""
         try:
             dialog = PlaneFormDialog(self, mode="add")
-            if dialog.exec():
-                self.load_planes()  # Refresh view after adding
+            dialog.exec()
         except Exception as e:
             QMessageBox.critical(self.view, "Error", f"Failed to open Add Plane dialog:\n{e}")
 
     # ------------------------------------------------------------
     def open_edit_plane(self, plane):
-        """Opens a dialog for editing an existing plane and reloads data after update."""
+        """Opens a dialog for editing an existing plane (the view is synced when it is saved)."""
         try:
             dialog = PlaneFormDialog(self, mode="edit", plane=plane)
-            if dialog.exec():
-                self.load_planes()  # Refresh view after update
+            dialog.exec()
         except Exception as e:
             QMessageBox.critical(self.view, "Error", f"Failed to open Edit Plane dialog:\n{e}")
 
@@ -102,25 +293,20 @@ class PlanePresenter:
         except Exception:
             return None
 
+    # ------------------------------------------------------------
+    def get_stats(self):
+        """Fetches statistics for the currently applied filters (None on failure)."""
+        try:
+            return PlaneEntity.get_stats(**self._filters)
+        except Exception as e:
+            self.view.show_status(f"⚠️ Failed to load statistics: {e}")
+            return None
+
     # ------------------------------------------------------------
     def get_displayed_planes(self):
         """
         Returns the list of currently displayed (filtered) planes in the view.
-        Filters by search text, manufacturer, and year based on user input.
+        Filtering by search text, manufacturer and year is done by the server,
+        so this is simply the loaded result set.
         """
-        if hasattr(self.view, "planes"):
-            search_text = self.view.search_input.text().strip().lower()
-            maker = self.view.made_by_combo.currentText()
-            year = self.view.year_combo.currentText()
-
-            filtered = []
-            for p in self.view.planes:
-                match_name = (
-                    search_text in p.Name.lower() or search_text in p.MadeBy.lower()
-                )
-                match_maker = maker == "All Manufacturers" or p.MadeBy == maker
-                match_year = year == "All Years" or str(p.Year) == year
-                if match_name and match_maker and match_year:
-                    filtered.append(p)
-            return filtered
-        return []
+        return list(getattr(self.view, "planes", []))
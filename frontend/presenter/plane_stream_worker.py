@@ -0,0 +1,63 @@
+from PySide6.QtCore import QObject, QThread, Signal
+from ..model.http import new_session
+from ..model.plane_entity import PlaneEntity
+
+
+class PlaneStreamWorker(QObject):
+    """Background loader that streams the fleet from the API.
+
+    Planes are decoded line by line (NDJSON) in a separate QThread and
+    handed to the GUI in small batches, so the first cards can be shown
+    long before the last rows arrive.
+    """
+
+    # Signals carry the worker itself so receivers can ignore stale streams
+    batch_ready = Signal(object, list)  # (worker, [PlaneEntity, ...])
+    finished = Signal(object, int)      # (worker, total planes received)
+    failed = Signal(object, str)        # (worker, error message)
+
+    def __init__(self, filters: dict, batch_size: int = 24):
+        """Initialize the worker with the API filters and the GUI batch size."""
+        super().__init__()
+        self.filters = filters
+        self.batch_size = batch_size
+        self._cancelled = False
+        self._thread = None
+
+    def start(self):
+        """Starts streaming in a dedicated background thread."""
+        self._thread = QThread()
+        self.moveToThread(self._thread)
+        self._thread.started.connect(self._run)
+        self._thread.finished.connect(self._thread.deleteLater)
+        self._thread.start()
+
+    def cancel(self):
+        """Stops the stream after the current line (e.g. when filters change)."""
+        self._cancelled = True
+
+    def _run(self):
+        """Executed inside the background thread: reads and batches the stream."""
+        count = 0
+        batch = []
+        # Own session: the GUI thread keeps using the shared one meanwhile
+        http_session = new_session()
+        try:
+            for plane in PlaneEntity.iter_stream(**self.filters, http_session=http_session):
+                if self._cancelled:
+                    break
+                batch.append(plane)
+                count += 1
+                if len(batch) >= self.batch_size:
+                    self.batch_ready.emit(self, batch)
+                    batch = []
+            if batch and not self._cancelled:
+                self.batch_ready.emit(self, batch)
+            self.finished.emit(self, count)
+        except Exception as e:
+            self.failed.emit(self, str(e))
+        finally:
+            http_session.close()
+
+        # Gracefully stop the worker thread (no blocking)
+        self._thread.quit()
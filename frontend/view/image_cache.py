@@ -0,0 +1,211 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+
+from ..model.http import IMAGE_CACHE_DIR, IMAGE_DISK_BYTES, IMAGE_MEMORY_BYTES
+
+
+# ============================================================
+# Two-tier image cache
+# ============================================================
+# 1. PixmapCache — decoded QPixmaps in memory, least recently used first
+#    out, bounded by pixel bytes (width × height × depth), not by count
+# 2. DiskImageCache — the encoded bytes of every downloaded image, keyed
+#    by sha256(URL), with the ETag / Last-Modified / max-age the server
+#    sent. Survives restarts: fresh entries are shown without any request,
+#    stale ones are shown too and revalidated in the background with
+#    If-None-Match / If-Modified-Since (image_loader.py).
+
+
+def pixmap_bytes(pix) -> int:
+    """Memory used by a QPixmap / QImage's pixels."""
+    return pix.width() * pix.height() * max(pix.depth(), 8) // 8
+
+
+class PixmapCache:
+    """In-memory LRU of decoded images (GUI thread only)."""
+
+    def __init__(self, max_bytes=IMAGE_MEMORY_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._items = OrderedDict()  # key → QPixmap
+
+    def get(self, key):
+        pix = self._items.get(key)
+        if pix is not None:
+            self._items.move_to_end(key)
+        return pix
+
+    def put(self, key, pix):
+        if pix is None or pix.isNull():
+            return
+        cost = pixmap_bytes(pix)
+        if cost > self.max_bytes:
+            return  # Would evict everything else
+        self.discard(key)
+        self._items[key] = pix
+        self.size += cost
+        while self.size > self.max_bytes:
+            _, old = self._items.popitem(last=False)
+            self.size -= pixmap_bytes(old)
+
+    def discard(self, key):
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.size -= pixmap_bytes(old)
+
+    def discard_url(self, url):
+        """Drop every decoded size of `url`."""
+        for key in [key for key in self._items if key[0] == url]:
+            self.discard(key)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+
+class DiskEntry:
+    """One cached download: encoded bytes plus the validators to revalidate them."""
+
+    def __init__(self, data, etag=None, last_modified=None, expires=0.0):
+        self.data = data
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires = expires  # Unix time until which no revalidation is needed
+
+    @property
+    def fresh(self):
+        return time.time() < self.expires
+
+    def conditional_headers(self):
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def _max_age(cache_control: str) -> int:
+    """max-age of a Cache-Control header (0 if missing or no-cache)."""
+    directives = [d.strip().lower() for d in (cache_control or "").split(",")]
+    if "no-cache" in directives or "no-store" in directives:
+        return 0
+    for d in directives:
+        if d.startswith("max-age="):
+            try:
+                return max(0, int(d.split("=", 1)[1]))
+            except ValueError:
+                return 0
+    return 0
+
+
+class DiskImageCache:
+    """
+    Persistent cache of downloaded image bytes (safe to use from pool threads).
+    - <dir>/<k[:2]>/<k>.img holds the bytes, <k>.json the URL and validators
+    - Total size is kept under max_bytes; least recently used files go first
+    """
+
+    def __init__(self, directory=IMAGE_CACHE_DIR, max_bytes=IMAGE_DISK_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size = None  # Computed on the first store
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        folder = os.path.join(self.directory, key[:2])
+        return folder, os.path.join(folder, f"{key}.img"), os.path.join(folder, f"{key}.json")
+
+    def get(self, url):
+        """The cached entry of `url`, or None."""
+        _, data_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(data_path, "rb") as f:
+                data = f.read()
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url:
+            return None  # Hash collision or foreign file
+        try:
+            os.utime(data_path)  # Recently used → pruned last
+        except OSError:
+            pass
+        return DiskEntry(data, meta.get("etag"), meta.get("last_modified"), meta.get("expires", 0.0))
+
+    def store(self, url, data, headers):
+        """Save a 200 response body with its validators."""
+        if "no-store" in (headers.get("Cache-Control") or "").lower():
+            return
+        expires = time.time() + _max_age(headers.get("Cache-Control"))
+        entry = DiskEntry(data, headers.get("ETag"), headers.get("Last-Modified"), expires)
+        self._write(url, entry, data)
+
+    def refresh(self, url, entry, headers):
+        """Record a 304 answer: the bytes stay, the expiry (and validators) are renewed."""
+        entry.etag = headers.get("ETag") or entry.etag
+        entry.last_modified = headers.get("Last-Modified") or entry.last_modified
+        entry.expires = time.time() + _max_age(headers.get("Cache-Control"))
+        self._write(url, entry, None)
+
+    def _write(self, url, entry, data):
+        folder, data_path, meta_path = self._paths(url)
+        try:
+            os.makedirs(folder, exist_ok=True)
+            suffix = f".{threading.get_ident()}.tmp"
+            if data is not None:
+                old_size = os.path.getsize(data_path) if os.path.exists(data_path) else 0
+                with open(data_path + suffix, "wb") as f:
+                    f.write(data)
+                os.replace(data_path + suffix, data_path)
+                self._grow(len(data) - old_size)
+            meta = {"url": url, "etag": entry.etag, "last_modified": entry.last_modified,
+                    "expires": entry.expires}
+            with open(meta_path + suffix, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(meta_path + suffix, meta_path)
+        except OSError:
+            pass  # A cache that cannot be written is just a cache miss next time
+
+    def _files(self):
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                if name.endswith(".img"):
+                    path = os.path.join(root, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    yield path, st.st_size, st.st_mtime
+
+    def _grow(self, delta):
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._files())
+            else:
+                self._size += delta
+            if self._size > self.max_bytes:
+                self._prune()
+
+    def _prune(self):
+        """Delete least recently used images until the cache is at 90% of its budget."""
+        files = sorted(self._files(), key=lambda f: f[2])
+        self._size = sum(size for _, size, _ in files)
+        target = self.max_bytes * 9 // 10
+        for path, size, _ in files:
+            if self._size <= target:
+                break
+            for p in (path, path[:-len(".img")] + ".json"):
+                try:
+                    os.remove(p)
+                except OSError:
+                    pass
+            self._size -= size
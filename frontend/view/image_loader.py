@@ -1,65 +1,307 @@
-from PySide6.QtCore import QObject, QThread, Signal
-from PySide6.QtGui import QPixmap
+import threading
+from PySide6.QtCore import Qt, QBuffer, QByteArray, QObject, QRunnable, QSize, QThreadPool, Signal
+from PySide6.QtGui import QImage, QImageReader, QPixmap
 import requests
 
+from .image_cache import DiskImageCache, PixmapCache
+from ..model.http import IMAGE_THREADS, new_session
+
+
+# ============================================================
+# Image fetch service — one shared, bounded pool for all images
+# ============================================================
+# Every card used to start its own QThread and download on a fresh
+# connection. Now all downloads go through one QThreadPool:
+# - At most IMAGE_THREADS downloads run at once; each pool thread keeps
+#   its own HTTP session (Sessions are not thread-safe), so connections
+#   are still reused between downloads
+# - Requests for the same URL are merged into one download
+# - Higher priority requests (visible cards) are started first
+# - Callers cancel requests they no longer need (hidden or deleted cards);
+#   queued downloads are dropped, running ones are ignored when they finish
+# Workers decode straight to the size the caller shows (QImageReader
+# scaled decoding), so a 4000px photo for a 260x150 card never exists in
+# memory at full size; only the QPixmap conversion runs on the GUI thread.
+# Results go through the two-tier cache (image_cache.py): a memory hit
+# answers at once, a disk entry without waiting for the network. Decoded
+# images are cached per (URL, size); the encoded bytes on disk are shared.
+# Stale disk entries are shown right away and revalidated afterwards by a
+# low-priority task (stale-while-revalidate), so a slow server never holds
+# a worker that visible cards are waiting for.
+
+IMAGE_TIMEOUT = (3, 6)
+REVALIDATE_TIMEOUT = (1.5, 3)
+
+# Priorities (higher runs first)
+REVALIDATE_PRIORITY = -10
+DEFAULT_PRIORITY = 0
+VISIBLE_PRIORITY = 10
+
+_thread_state = threading.local()
+
+
+def _image_session():
+    """HTTP session of the current pool thread (created on its first download)."""
+    session = getattr(_thread_state, "session", None)
+    if session is None:
+        session = _thread_state.session = new_session()
+    return session
+
+
+def _revalidate_session():
+    """Session of the current pool thread for revalidations: one attempt, no retries
+    (a failed revalidation only means the stale copy is kept a little longer)."""
+    session = getattr(_thread_state, "revalidate_session", None)
+    if session is None:
+        session = _thread_state.revalidate_session = requests.Session()
+    return session
+
+
+def image_key(url, size=None):
+    """Cache / request key of `url` decoded to fit `size` (None = full size)."""
+    return (url, size.width(), size.height()) if size is not None else (url, 0, 0)
+
+
+def decode_image(reader, size=None):
+    """Decode with `reader`, scaled down (aspect kept) to fit `size` while decoding."""
+    reader.setAutoTransform(True)
+    if size is not None:
+        source = reader.size()
+        if source.isValid() and (source.width() > size.width() or source.height() > size.height()):
+            reader.setScaledSize(source.scaled(size, Qt.KeepAspectRatio))
+            reader.setQuality(100)  # Smooth scaling after the JPEG's reduced-scale decode
+    return reader.read()
+
+
+class _FetchTask(QRunnable):
+    """Downloads (or reads) and decodes one image in a pool thread."""
+
+    def __init__(self, key, service, priority):
+        super().__init__()
+        self.setAutoDelete(False)  # The service keeps it (tryTake needs a live object)
+        self.key = key
+        self.url = key[0]
+        self.size = QSize(key[1], key[2]) if key[1] else None
+        self.service = service
+        self.priority = priority
+
+    def run(self):
+        image = QImage()
+        try:
+            if self.url.startswith("http"):
+                data = self._download()
+                if data:
+                    buffer = QBuffer()
+                    buffer.setData(QByteArray(data))
+                    image = decode_image(QImageReader(buffer), self.size)
+            else:
+                image = decode_image(QImageReader(self.url), self.size)
+        except Exception:
+            pass  # Silent fail: callers get an empty pixmap
+        self.service.task_done.emit(self.key, image)
+
+    def _download(self):
+        """Image bytes from the disk cache (revalidated later when stale), else from the network."""
+        disk = self.service.disk
+        entry = disk.get(self.url)
+        if entry is not None:
+            if not entry.fresh:
+                self.service.revalidate(self.url)
+            return entry.data
+        try:
+            r = _image_session().get(self.url, timeout=IMAGE_TIMEOUT)
+        except requests.RequestException:
+            return None
+        if r.status_code == 200:
+            disk.store(self.url, r.content, r.headers)
+            return r.content
+        return None
+
+
+class _RevalidateTask(QRunnable):
+    """Checks a stale disk entry with a conditional GET, after the image was shown."""
+
+    def __init__(self, url, service):
+        super().__init__()
+        self.url = url
+        self.service = service
+
+    def run(self):
+        disk = self.service.disk
+        try:
+            entry = disk.get(self.url)
+            if entry is None or entry.fresh:
+                return  # Evicted, or refreshed meanwhile
+            r = _revalidate_session().get(self.url, headers=entry.conditional_headers(), timeout=REVALIDATE_TIMEOUT)
+            if r.status_code == 304:
+                disk.refresh(self.url, entry, r.headers)
+            elif r.status_code == 200:
+                disk.store(self.url, r.content, r.headers)
+                if r.content != entry.data:
+                    self.service.revalidated.emit(self.url)
+        except Exception:
+            pass  # Offline: keep showing the stale copy, check again next time
+        finally:
+            self.service.revalidation_done(self.url)
+
+
+class ImageFetchService(QObject):
+    """Shared image downloader (use image_service() to get the instance)."""
+
+    # Emitted from pool threads (key, image); delivered to _on_task_done on the GUI thread
+    task_done = Signal(object, QImage)
+    # Emitted from pool threads (url) when revalidation brought new bytes
+    revalidated = Signal(str)
+
+    def __init__(self, max_threads=IMAGE_THREADS):
+        super().__init__()
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        self._tasks = {}    # image_key → _FetchTask queued or running
+        self._waiting = {}  # image_key → {ticket: callback(url, QPixmap)}
+        self._tickets = {}  # ticket → image_key
+        self._next_ticket = 0
+        self._revalidating = set()  # URLs with a _RevalidateTask queued or running
+        self._revalidating_lock = threading.Lock()  # Used from pool threads
+        self.memory = PixmapCache()
+        self.disk = DiskImageCache()
+        self.task_done.connect(self._on_task_done)
+        self.revalidated.connect(self.memory.discard_url)  # Next fetch decodes the new bytes
+
+    def fetch(self, url, callback, priority=DEFAULT_PRIORITY, size=None):
+        """
+        Request `url` decoded to fit `size` (QSize, None = full size);
+        `callback(url, pixmap)` runs on the GUI thread.
+        Returns a ticket for cancel(), or None if the memory cache answered right away.
+        """
+        key = image_key(url, size)
+        pix = self.memory.get(key)
+        if pix is not None:
+            callback(url, pix)
+            return None
+        self._next_ticket += 1
+        ticket = self._next_ticket
+        self._tickets[ticket] = key
+        self._waiting.setdefault(key, {})[ticket] = callback
+        if key in self._tasks:
+            self.prioritize(key, priority)
+        else:
+            self._start(key, priority)
+        return ticket
+
+    def prioritize(self, key, priority):
+        """Move a queued request (image_key) ahead if `priority` is higher than its current one."""
+        task = self._tasks.get(key)
+        if task is not None and priority > task.priority and self.pool.tryTake(task):
+            self._start(key, priority)
+
+    def prioritize_ticket(self, ticket, priority):
+        key = self._tickets.get(ticket)
+        if key is not None:
+            self.prioritize(key, priority)
+
+    def cancel(self, ticket):
+        """Forget a request; the download itself is dropped once nobody waits for it."""
+        key = self._tickets.pop(ticket, None)
+        waiting = self._waiting.get(key)
+        if not waiting:
+            return
+        waiting.pop(ticket, None)
+        if not waiting:
+            del self._waiting[key]
+            task = self._tasks.get(key)
+            if task is not None and self.pool.tryTake(task):
+                del self._tasks[key]
+
+    def pending(self):
+        """Number of downloads queued or running."""
+        return len(self._tasks)
+
+    def revalidate(self, url):
+        """Queue a background revalidation of `url`'s disk entry (once at a time per URL)."""
+        with self._revalidating_lock:
+            if url in self._revalidating:
+                return
+            self._revalidating.add(url)
+        self.pool.start(_RevalidateTask(url, self), REVALIDATE_PRIORITY)
+
+    def revalidation_done(self, url):
+        with self._revalidating_lock:
+            self._revalidating.discard(url)
+
+    def _start(self, key, priority):
+        task = _FetchTask(key, self, priority)
+        self._tasks[key] = task
+        self.pool.start(task, priority)
+
+    def _on_task_done(self, key, image):
+        self._tasks.pop(key, None)
+        callbacks = self._waiting.pop(key, {})
+        if not callbacks:
+            return  # Everybody cancelled while it was running
+        for ticket in callbacks:
+            self._tickets.pop(ticket, None)
+        pix = QPixmap.fromImage(image) if not image.isNull() else QPixmap()
+        self.memory.put(key, pix)
+        for callback in callbacks.values():
+            callback(key[0], pix)
+
+
+_service = None
+
+
+def image_service():
+    """The shared ImageFetchService (created on first use, after the QApplication)."""
+    global _service
+    if _service is None:
+        _service = ImageFetchService()
+    return _service
+
 
 class ImageLoader(QObject):
-    """Asynchronous image loader using QThread.
+    """Loads one image through the shared ImageFetchService.
 
-    This class downloads an image (either from the web or a local path)
-    in a separate background thread, to prevent blocking the UI.
-    Once the image is ready, it emits the 'finished' signal with the URL
-    and the resulting QPixmap object.
+    Emits 'finished' with the URL and the resulting QPixmap (empty on
+    failure), already scaled to fit `size` when one is given.
+    cancel() withdraws the request, e.g. when the card that asked for it
+    is hidden or deleted.
     """
 
     # Signal emitted when the image is fully loaded (url, pixmap)
     finished = Signal(str, QPixmap)
 
-    def __init__(self, url: str):
-        """Initialize the loader with the image URL or file path."""
+    def __init__(self, url: str, priority: int = DEFAULT_PRIORITY, size: QSize = None):
+        """Initialize the loader with the image URL or file path and the display size."""
         super().__init__()
         self.url = url
-        self._thread = None  # Each loader instance manages its own QThread
+        self.priority = priority
+        self.size = size
+        self._ticket = None
 
     def load(self):
-        """Starts the image loading process asynchronously."""
+        """Queues the image request (non-blocking for the UI)."""
         if not self.url:
             # Emit an empty pixmap immediately if URL is missing
             self.finished.emit(self.url, QPixmap())
             return
+        self._ticket = image_service().fetch(self.url, self._on_loaded, self.priority, self.size)
 
-        # Create a background thread dedicated to this loader
-        self._thread = QThread()
-        self.moveToThread(self._thread)
+    def prioritize(self, priority: int):
+        """Raise the priority of a request that is still queued."""
+        self.priority = max(self.priority, priority)
+        if self._ticket is not None:
+            image_service().prioritize_ticket(self._ticket, self.priority)
 
-        # Connect thread start → actual loading function
-        self._thread.started.connect(self._do_load)
-
-        # Ensure proper cleanup when thread finishes
-        self._thread.finished.connect(self._thread.deleteLater)
-
-        # Start the background thread
-        self._thread.start()
-
-    def _do_load(self):
-        """Executed inside the background thread.
-        Performs the actual image download (non-blocking for the UI)."""
-        pix = QPixmap()
-        try:
-            if self.url.startswith("http"):
-                # Load image from a remote URL
-                r = requests.get(self.url, timeout=4)
-                if r.status_code == 200:
-                    pix.loadFromData(r.content)
-            else:
-                # Load image from local filesystem
-                pix.load(self.url)
-        except Exception:
-            # Silent fail: emit empty pixmap if download fails
-            pass
+    def cancel(self):
+        """Withdraw the request; 'finished' will not be emitted."""
+        if self._ticket is not None:
+            image_service().cancel(self._ticket)
+            self._ticket = None
 
-        # Notify listeners (e.g., PlaneCard) that image is ready
-        self.finished.emit(self.url, pix)
+    @property
+    def pending(self):
+        return self._ticket is not None
 
-        # Gracefully stop the worker thread (no blocking)
-        self._thread.quit()
+    def _on_loaded(self, url, pix):
+        self._ticket = None
+        self.finished.emit(url, pix)
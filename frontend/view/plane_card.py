@@ -4,21 +4,23 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, QSize, QPropertyAnimation, Signal
 from PySide6.QtGui import QColor, QPixmap
 from .image_loader import ImageLoader
+from ..model.http import thumbnail_url
 
 
 class PlaneCard(QFrame):
     """UI card displaying a single plane, including image, info, and hover animations."""
     clicked = Signal(object)  # Emits the Plane object when the card is clicked
 
-    def __init__(self, plane, cache_manager, presenter):
-        """Initialize the card with plane data, cache manager, and presenter."""
+    def __init__(self, plane, presenter):
+        """Initialize the card with plane data and presenter (images are cached by the image service)."""
         super().__init__()
         self.plane = plane
-        self.cache = cache_manager
         self.presenter = presenter
         self.setCursor(Qt.PointingHandCursor)
         self.setFixedSize(340, 290)
         self._destroyed = False
+        self._loader = None      # Pending image request (None once it finished)
+        self._image_url = None
 
         self._build_ui()
         self._load_image()
@@ -61,46 +63,85 @@ class PlaneCard(QFrame):
         layout.addWidget(self.img, alignment=Qt.AlignCenter)
 
         # Plane name
-        name = QLabel(self.plane.Name)
-        name.setObjectName("cardTitle")
-        name.setAlignment(Qt.AlignCenter)
-        layout.addWidget(name)
+        self.name_label = QLabel(self.plane.Name)
+        self.name_label.setObjectName("cardTitle")
+        self.name_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.name_label)
 
         # Plane info line (manufacturer, year, seat count)
-        total = self.plane.NumOfSeats1 + self.plane.NumOfSeats2 + self.plane.NumOfSeats3
-        info = QLabel(f"{self.plane.MadeBy} · {self.plane.Year} · Seats: {total}")
-        info.setObjectName("cardSub")
-        info.setAlignment(Qt.AlignCenter)
-        layout.addWidget(info)
+        self.info_label = QLabel(self._info_text())
+        self.info_label.setObjectName("cardSub")
+        self.info_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.info_label)
+
+    def _info_text(self):
+        return f"{self.plane.MadeBy} · {self.plane.Year} · Seats: {self.plane.total_seats}"
+
+    # ------------------------------------------------------------
+    def set_plane(self, plane):
+        """Show another plane (edited data, or a recycled card); reloads the image only if it changed."""
+        old_picture = self.plane.Picture
+        self.plane = plane
+        self.name_label.setText(plane.Name)
+        self.info_label.setText(self._info_text())
+        if plane.Picture != old_picture:
+            self.img.clear()
+            self._load_image()
+
+    def dispose(self):
+        """Delete the card; late image callbacks are ignored."""
+        self._destroyed = True
+        self.cancel_image()
+        self.deleteLater()
 
     # ------------------------------------------------------------
     def _load_image(self):
         """Loads the plane image asynchronously using ImageLoader.
         This ensures the UI remains responsive while images are downloading."""
+        self.cancel_image()
+        self._image_url = None
         if not self.plane.Picture:
-            self._fade_in_image(QPixmap("frontend/assets/icons/airplane.svg"))
+            self._fade_in_image(None)  # Fallback icon
             return
 
-        loader = ImageLoader(self.plane.Picture)
-        loader.finished.connect(lambda url, pix: self._update_image_and_cleanup(loader, url, pix))
-        loader.load()
+        # Small pre-sized thumbnail from the API (sized for the image label)
+        url = thumbnail_url(self.plane.Picture, self.img.width(), self.img.height())
+        self._image_url = url
+        self._loader = ImageLoader(url, size=self.img.size())  # Decoded to fit the label by a worker
+        self._loader.finished.connect(self._update_image_and_cleanup)
+        self._loader.load()
 
-    def _update_image_and_cleanup(self, loader, url, pix):
-        """Triggered once the background thread finishes loading the image."""
+    def _update_image_and_cleanup(self, url, pix):
+        """Triggered once the shared image service delivered the image."""
+        self._loader = None
         self._update_image(url, pix)
 
+    def cancel_image(self):
+        """Withdraw a pending image request (card hidden, recycled or deleted)."""
+        if self._loader is not None:
+            self._loader.cancel()
+            self._loader = None
+
+    def ensure_image(self):
+        """Request the image again if an earlier request was cancelled before it finished."""
+        if self._loader is None and self._image_url and self.img.pixmap().isNull():
+            self._load_image()
+
+    def prioritize_image(self, priority):
+        """Raise the priority of a pending image request (e.g. the card became visible)."""
+        if self._loader is not None:
+            self._loader.prioritize(priority)
+
     def _update_image(self, url, pix):
         """Updates the card with the newly loaded image."""
-        if self._destroyed:
-            return
+        if self._destroyed or url != self._image_url:
+            return  # Card deleted, or it shows another plane/picture by now
 
         # Use fallback icon if image failed to load
         if not pix or pix.isNull():
-            self._fade_in_image(QPixmap("frontend/assets/icons/airplane.svg"))
+            self._fade_in_image(None)  # Fallback icon
             return
 
-        # Cache the image for later reuse
-        self.cache.cache[url] = pix
         self._fade_in_image(pix)
 
     # ------------------------------------------------------------
@@ -110,11 +151,13 @@ class PlaneCard(QFrame):
             return
 
         if pix is None or not hasattr(pix, "scaled") or pix.isNull():
-            pix = QPixmap("frontend/assets/icons/airplane.svg")
+            pix = QPixmap("frontend/assets/icons/airplane.svg").scaled(
+                self.img.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        elif pix.width() > self.img.width() or pix.height() > self.img.height():
+            # Loaded images are decoded to fit the label by the worker; this is only a safety net
+            pix = pix.scaled(self.img.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
 
-        # Scale and show image
-        scaled = pix.scaled(self.img.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self.img.setPixmap(scaled)
+        self.img.setPixmap(pix)
 
         # Fade-in effect for smooth visual appearance
         opacity = QGraphicsOpacityEffect()
@@ -4,7 +4,8 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QPixmap, QIcon
-import requests
+from .image_loader import ImageLoader, VISIBLE_PRIORITY
+from ..model.http import picture_url
 
 
 class PlaneDetailsDialog(QDialog):
@@ -13,12 +14,12 @@ class PlaneDetailsDialog(QDialog):
     It is view-only but includes an Edit button that allows users to modify plane data.
     """
 
-    def __init__(self, parent, plane, cache_manager, presenter):
+    def __init__(self, parent, plane, presenter):
         super().__init__(parent)
         self.plane = plane
-        self.cache = cache_manager
         self.presenter = presenter
         self.fields = {}  # will store QLabel references for dynamic updates
+        self._loader = None  # Pending image request
 
         # --- Window setup ---
         self.setWindowTitle(f"Plane Details – {plane.Name}")
@@ -131,24 +132,35 @@ class PlaneDetailsDialog(QDialog):
 
     # ------------------------------------------------------------
     def _load_image(self):
-        """Loads the plane image from a URL or uses a fallback icon if unavailable."""
-        url = self.plane.Picture
+        """Shows the fallback icon, then the plane image once a worker decoded it at the label size."""
+        self._show_fallback()
+        if self._loader is not None:
+            self._loader.cancel()
+            self._loader = None
+
+        url = picture_url(self.plane.Picture)
+        if url and url.startswith("http"):
+            self._loader = ImageLoader(url, VISIBLE_PRIORITY, self.img_label.size())
+            self._loader.finished.connect(self._on_image_loaded)
+            self._loader.load()
+
+    def _on_image_loaded(self, url, pix):
+        self._loader = None
+        if url == picture_url(self.plane.Picture) and not pix.isNull():
+            self.img_label.setPixmap(pix)  # Already decoded to fit the label
+
+    def _show_fallback(self):
         pix = QPixmap("frontend/assets/icons/airplane.svg")
-
-        try:
-            if url and url.startswith("http"):
-                r = requests.get(url, timeout=3)
-                if r.status_code == 200:
-                    p = QPixmap()
-                    p.loadFromData(r.content)
-                    if not p.isNull():
-                        pix = p
-        except Exception:
-            pass
-
         scaled = pix.scaled(self.img_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
         self.img_label.setPixmap(scaled)
 
+    def done(self, result):
+        """Drop a pending image request when the dialog closes."""
+        if self._loader is not None:
+            self._loader.cancel()
+            self._loader = None
+        super().done(result)
+
     # ------------------------------------------------------------
     def _edit_plane(self):
         """Opens the Edit Plane dialog and refreshes data after editing."""
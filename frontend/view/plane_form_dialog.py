@@ -6,6 +6,7 @@ from PySide6.QtCore import Qt, QSize
 from PySide6.QtGui import QPixmap, QIcon, QIntValidator
 import requests
 import datetime
+from ..model.http import picture_url
 
 
 class PlaneFormDialog(QDialog):
@@ -162,6 +163,18 @@ class PlaneFormDialog(QDialog):
             "NumOfSeats3": int(self.inputs["NumOfSeats3"].text().strip() or 0),
         }
 
+    # ------------------------------------------------------------
+    def _changed_fields(self, data):
+        """מחזירה רק את השדות ששונו לעומת המטוס שנטען (נשלח כ-PATCH)"""
+        changes = {}
+        for key, value in data.items():
+            original = getattr(self.plane, key, None)
+            if key == "Picture":
+                original = original or ""  # None ו-"" הם אותו ערך בטופס
+            if value != original:
+                changes[key] = value
+        return changes
+
     # ------------------------------------------------------------
     def _validate_form(self, data):
         """בודקת שהנתונים שהוזנו תקינים"""
@@ -195,7 +208,7 @@ class PlaneFormDialog(QDialog):
             return
 
         try:
-            response = requests.get(url, timeout=5)
+            response = requests.get(picture_url(url), timeout=5)
             if response.status_code == 200:
                 pix = QPixmap()
                 pix.loadFromData(response.content)
@@ -221,10 +234,11 @@ class PlaneFormDialog(QDialog):
                 QMessageBox.warning(self, "Invalid Data", err)
                 return
 
+            if self.mode == "edit" and self.plane:
+                data = self._changed_fields(data)
             success, msg = self.presenter.save_plane(self.mode, data, self.plane)
             if success:
-                if hasattr(self.presenter, "load_planes"):
-                    self.presenter.load_planes()
+                # The presenter has already applied the change to the list
                 self.accept()
             elif msg:
                 QMessageBox.critical(self, "Error", msg)
@@ -0,0 +1,252 @@
+from collections import OrderedDict
+from PySide6.QtWidgets import QListView, QStyledItemDelegate, QStyle, QAbstractItemView
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QPoint, QRectF, QSize, QTimer, Signal
+from PySide6.QtGui import QColor, QFont, QPainter, QPainterPath, QPen, QPixmap
+
+from .image_loader import ImageLoader, VISIBLE_PRIORITY
+from ..model.http import thumbnail_url
+
+
+# ============================================================
+# Virtualized plane grid (FLYSMART_GRID=virtual)
+# ============================================================
+# One QListView in icon mode replaces the QFrame-per-plane grid:
+# - PlaneListModel holds the plane list; only rows the view paints
+#   ask for their image, so downloads follow the viewport
+# - PlaneCardDelegate paints the card (image, name, info line, hover lift)
+# Memory and paint cost scale with the visible cards, not with the fleet.
+
+PlaneRole = Qt.UserRole + 1
+
+CARD_SIZE = QSize(340, 290)
+IMAGE_SIZE = QSize(260, 150)
+CARD_MARGIN = 8            # Room around each card for the shadow and the hover lift
+HOVER_LIFT = 6
+
+# Scaled card images kept in memory (least recently used are dropped)
+PIXMAP_CACHE_SIZE = 256
+
+FALLBACK_ICON = "frontend/assets/icons/airplane.svg"
+
+
+class PlaneListModel(QAbstractListModel):
+    """List model over PlaneEntity objects; loads card images lazily."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._planes = []
+        self._pixmaps = OrderedDict()  # image URL → pixmap decoded to fit IMAGE_SIZE
+        self._loaders = {}             # image URL → ImageLoader in flight
+        self._fallback = None
+
+        # Image arrivals are coalesced into one repaint
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(0)
+        self._repaint_timer.timeout.connect(self._emit_images_changed)
+
+    # ------------------------------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._planes)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._planes):
+            return None
+        plane = self._planes[index.row()]
+        if role == PlaneRole:
+            return plane
+        if role == Qt.DisplayRole:
+            return plane.Name
+        if role == Qt.DecorationRole:
+            return self._pixmap_for(plane)
+        return None
+
+    # ------------------------------------------------------------
+    def set_planes(self, planes):
+        """Replace the whole list (new result set)."""
+        self.beginResetModel()
+        self._planes = list(planes)
+        self.endResetModel()
+
+    def append_planes(self, planes):
+        """Add rows at the end (next page, new plane)."""
+        if not planes:
+            return
+        first = len(self._planes)
+        self.beginInsertRows(QModelIndex(), first, first + len(planes) - 1)
+        self._planes.extend(planes)
+        self.endInsertRows()
+
+    def update_plane(self, plane):
+        """Replace the row of an edited plane."""
+        row = self.row_of(plane.PlaneId)
+        if row is not None:
+            self._planes[row] = plane
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+    def remove_plane(self, plane_id):
+        """Remove the row of a deleted plane."""
+        row = self.row_of(plane_id)
+        if row is not None:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._planes[row]
+            self.endRemoveRows()
+
+    def row_of(self, plane_id):
+        for row, plane in enumerate(self._planes):
+            if plane.PlaneId == plane_id:
+                return row
+        return None
+
+    # ------------------------------------------------------------
+    def _pixmap_for(self, plane):
+        """Scaled image of `plane`, or None while it is still loading."""
+        if not plane.Picture:
+            return self._fallback_pixmap()
+        url = self.image_url(plane)
+        pix = self._pixmaps.get(url)
+        if pix is not None:
+            self._pixmaps.move_to_end(url)
+            return pix
+        if url not in self._loaders:
+            # Only painted rows get here, so these requests are for visible cards
+            loader = ImageLoader(url, VISIBLE_PRIORITY, IMAGE_SIZE)  # Decoded at card size by a worker
+            loader.finished.connect(self._on_image_loaded)
+            self._loaders[url] = loader
+            loader.load()
+        return None
+
+    @staticmethod
+    def image_url(plane):
+        return thumbnail_url(plane.Picture, IMAGE_SIZE.width(), IMAGE_SIZE.height())
+
+    def cancel_images_except(self, urls):
+        """Cancel pending image requests that are not in `urls` (rows scrolled away)."""
+        for url in [u for u in self._loaders if u not in urls]:
+            self._loaders.pop(url).cancel()
+
+    def _on_image_loaded(self, url, pix):
+        self._loaders.pop(url, None)
+        if pix.isNull():
+            pix = self._fallback_pixmap()
+        self._pixmaps[url] = pix
+        while len(self._pixmaps) > PIXMAP_CACHE_SIZE:
+            self._pixmaps.popitem(last=False)
+        self._repaint_timer.start()
+
+    def _emit_images_changed(self):
+        if self._planes:
+            self.dataChanged.emit(self.index(0), self.index(len(self._planes) - 1), [Qt.DecorationRole])
+
+    def _fallback_pixmap(self):
+        if self._fallback is None:
+            self._fallback = QPixmap(FALLBACK_ICON).scaled(IMAGE_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return self._fallback
+
+
+class PlaneCardDelegate(QStyledItemDelegate):
+    """Paints one plane card; mirrors the look of PlaneCard."""
+
+    def sizeHint(self, option, index):
+        return QSize(CARD_SIZE.width() + 2 * CARD_MARGIN, CARD_SIZE.height() + 2 * CARD_MARGIN)
+
+    def paint(self, painter, option, index):
+        plane = index.data(PlaneRole)
+        if plane is None:
+            return
+        hovered = bool(option.state & QStyle.State_MouseOver)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        card = QRectF(option.rect.adjusted(CARD_MARGIN, CARD_MARGIN, -CARD_MARGIN, -CARD_MARGIN))
+        if hovered:
+            card.translate(0, -HOVER_LIFT)
+
+        # Soft shadow: a few translucent rounded rects below the card
+        shadow_alpha, shadow_offset = (22, 6) if hovered else (10, 3)
+        painter.setPen(Qt.NoPen)
+        for spread in range(3, 0, -1):
+            painter.setBrush(QColor(0, 0, 0, shadow_alpha // spread))
+            painter.drawRoundedRect(card.adjusted(-spread, shadow_offset - spread, spread, shadow_offset + spread), 18, 18)
+
+        # Card background
+        path = QPainterPath()
+        path.addRoundedRect(card, 18, 18)
+        painter.fillPath(path, QColor("#F9FCFF") if hovered else QColor("white"))
+        painter.setBrush(Qt.NoBrush)
+        painter.setPen(QPen(QColor("#B5D9E8") if hovered else QColor("#D8E8EE"), 1))
+        painter.drawPath(path)
+
+        # Image (centered in the 260x150 box; nothing while it loads)
+        image_box = QRectF(card.center().x() - IMAGE_SIZE.width() / 2, card.top() + 16,
+                           IMAGE_SIZE.width(), IMAGE_SIZE.height())
+        pix = index.data(Qt.DecorationRole)
+        if pix is not None and not pix.isNull():
+            x = image_box.center().x() - pix.width() / 2
+            y = image_box.center().y() - pix.height() / 2
+            painter.drawPixmap(int(x), int(y), pix)
+
+        # Name and info line
+        name_rect = QRectF(card.left() + 16, image_box.bottom() + 10, card.width() - 32, 26)
+        font = QFont(option.font)
+        font.setPixelSize(16)
+        font.setWeight(QFont.DemiBold)
+        painter.setFont(font)
+        painter.setPen(QColor("#1A2C3A"))
+        painter.drawText(name_rect, Qt.AlignCenter, painter.fontMetrics().elidedText(
+            plane.Name or "", Qt.ElideRight, int(name_rect.width())))
+
+        info_rect = QRectF(card.left() + 16, name_rect.bottom() + 6, card.width() - 32, 22)
+        font.setPixelSize(13)
+        font.setWeight(QFont.Normal)
+        painter.setFont(font)
+        painter.setPen(QColor("#5A6D78"))
+        painter.drawText(info_rect, Qt.AlignCenter,
+                         f"{plane.MadeBy} · {plane.Year} · Seats: {plane.total_seats}")
+        painter.restore()
+
+
+class PlaneGridView(QListView):
+    """Icon-mode list view showing plane cards; emits plane_clicked(plane)."""
+    plane_clicked = Signal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.plane_model = PlaneListModel(self)
+        self.setModel(self.plane_model)
+        self.setItemDelegate(PlaneCardDelegate(self))
+
+        self.setViewMode(QListView.IconMode)
+        self.setResizeMode(QListView.Adjust)
+        self.setMovement(QListView.Static)
+        self.setFlow(QListView.LeftToRight)
+        self.setWrapping(True)
+        self.setUniformItemSizes(True)
+        self.setSpacing(2)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.verticalScrollBar().setSingleStep(24)
+        self.setMouseTracking(True)  # Hover state for the delegate
+        self.viewport().setCursor(Qt.PointingHandCursor)
+        self.setFrameShape(QListView.NoFrame)
+        self.setStyleSheet("QListView { background: transparent; }")
+
+        self.clicked.connect(lambda index: self.plane_clicked.emit(index.data(PlaneRole)))
+
+    def cancel_hidden_images(self):
+        """Cancel image requests of rows that left the viewport (painting them again re-requests)."""
+        area = self.viewport().rect()
+        index = self.indexAt(QPoint(CARD_MARGIN, CARD_MARGIN))
+        urls = set()
+        row = index.row() if index.isValid() else 0
+        while row < self.plane_model.rowCount():
+            rect = self.visualRect(self.plane_model.index(row))
+            if rect.top() > area.bottom():
+                break
+            if rect.intersects(area):
+                plane = self.plane_model.index(row).data(PlaneRole)
+                if plane.Picture:
+                    urls.add(self.plane_model.image_url(plane))
+            row += 1
+        self.plane_model.cancel_images_except(urls)
@@ -20,11 +20,11 @@ from datetime import datetime
 class PlaneStatsDialog(QDialog):
     """חלון דיאגרמות המציג סיכום חזותי של המטוסים המוצגים כרגע."""
 
-    def __init__(self, planes, parent=None):
+    def __init__(self, stats, parent=None):
         super().__init__(parent)
         self.setWindowFlags(Qt.Window)  # מאפשר מקסום, הצמדה, Alt+Tab
         self.setWindowModality(Qt.NonModal)  # לא חוסם את החלון הראשי
-        self.planes = planes
+        self.stats = stats  # /planes/stats payload (aggregated by the server)
 
         self.setWindowTitle("Planes Statistics")
         self.resize(900, 650)
@@ -113,7 +113,7 @@ class PlaneStatsDialog(QDialog):
         main.addWidget(container)
 
         # טען נתונים
-        self.update_charts(planes)
+        self.update_charts(stats)
         export_btn.clicked.connect(self.export_charts_to_png)
 
     # ------------------------------------------------------------
@@ -152,17 +152,24 @@ class PlaneStatsDialog(QDialog):
         self.chart_views.append(chart_view)
 
     # ------------------------------------------------------------
-    def update_charts(self, planes):
-        """בניית התרשימים לפי הנתונים"""
-        if not planes:
+    def update_charts(self, stats):
+        """בניית התרשימים לפי הנתונים (payload מצטבר מ-GET /planes/stats)"""
+        self.stats = stats
+        if not stats or not stats.get("total"):
             self.summary_label.setText("No data available.")
             return
 
         # ======== 1. Pie chart: יצרנים ========
-        manufacturer_count = {}
-        for p in planes:
-            m = getattr(p, "MadeBy", None) or "Unknown"
-            manufacturer_count[m] = manufacturer_count.get(m, 0) + 1
+        manufacturer_count = {
+            (m["MadeBy"] or "Unknown"): m["count"] for m in stats["manufacturers"]
+        }
+
+        seats = stats["seats"]
+        summary_text = (
+            f"Total planes: {stats['total']} | Manufacturers: {len(manufacturer_count)} | "
+            f"Years: {len(stats['years'])} | Seats: {seats['NumOfSeats1']} first / "
+            f"{seats['NumOfSeats2']} business / {seats['NumOfSeats3']} economy"
+        )
 
         pie_series = QPieSeries()
         for manufacturer, count in manufacturer_count.items():
@@ -187,12 +194,7 @@ class PlaneStatsDialog(QDialog):
                 slice_.setExploded(False)
                 slice_.setLabelFont(QFont("Segoe UI", 9))
                 # שחזור הטקסט הכללי כשהעכבר עוזב
-                total = len(planes)
-                num_manufacturers = len(manufacturer_count)
-                num_years = len({getattr(p, 'Year', 'Unknown') for p in planes})
-                self.summary_label.setText(
-                    f"Total planes: {total} | Manufacturers: {num_manufacturers} | Years: {num_years}"
-                )
+                self.summary_label.setText(summary_text)
 
         # חיבור לכל הפרוסות
         for s in pie_series.slices():
@@ -219,19 +221,19 @@ class PlaneStatsDialog(QDialog):
         chart1.setTitle("Distribution by Manufacturer")
 
         # ======== 2. Bar chart: לפי שנת ייצור ========
+        bucket = stats.get("year_bucket", 1)
         year_count = {}
-        for p in planes:
-            y = str(getattr(p, "Year", None) or "Unknown")
-            year_count[y] = year_count.get(y, 0) + 1
+        for row in stats["years"]:
+            start = row["Year"]
+            label = str(start) if bucket == 1 else f"{start}–{start + bucket - 1}"
+            year_count[label] = row["count"]
 
         bar_set = QBarSet("Planes")
         bar_set.setColor(QColor("#4BA3C7"))
         bar_set.setBorderColor(QColor("#357A9D"))
 
-        # רק 10 השנים האחרונות
-        years_sorted = sorted(
-            [y for y in year_count.keys() if y.isdigit()], key=lambda x: int(x)
-        )
+        # רק 10 השנים האחרונות (השרת מחזיר אותן ממוינות)
+        years_sorted = list(year_count.keys())
         recent_years = years_sorted[-10:] if len(years_sorted) > 10 else years_sorted
 
         for y in recent_years:
@@ -329,12 +331,7 @@ class PlaneStatsDialog(QDialog):
 
 
         # ======== סיכום ========
-        total = len(planes)
-        num_manufacturers = len(manufacturer_count)
-        num_years = len(year_count)
-        self.summary_label.setText(
-            f"Total planes: {total} | Manufacturers: {num_manufacturers} | Years: {num_years}"
-        )
+        self.summary_label.setText(summary_text)
 
     # ------------------------------------------------------------
     def eventFilter(self, obj, event):
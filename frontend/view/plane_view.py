@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -12,20 +13,15 @@ from PySide6.QtWidgets import (
     QListWidgetItem,
     QComboBox,
 )
-from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtCore import Qt, QPoint, QRect, QTimer, Signal
 from PySide6.QtGui import QLinearGradient, QPalette, QColor, QBrush, QIcon
 
 from .plane_card import PlaneCard
+from .image_loader import VISIBLE_PRIORITY
+from .plane_grid import PlaneGridView
 from .plane_details_dialog import PlaneDetailsDialog
 from .plane_stats_dialog import PlaneStatsDialog
-
-
-# ============================================================
-# Simple cache for storing loaded images (QPixmaps)
-# ============================================================
-class SimpleCache:
-    def __init__(self):
-        self.cache = {}  # URL or path → QPixmap
+from ..model.http import CARD_POOL_SIZE, GRID_MODE
 
 
 # ============================================================
@@ -52,13 +48,35 @@ class MultiSelectComboBox(QComboBox):
             item.setCheckState(Qt.Unchecked)
             self.popup_widget.addItem(item)
 
-    def update_selection(self):
-        """Update the displayed text and emit the selected items list."""
-        selected = [
+    def add_items(self, items):
+        """Add items that are not listed yet, keeping the current check states."""
+        existing = {
+            self.popup_widget.item(i).text() for i in range(self.popup_widget.count())
+        }
+        for item_text in items:
+            if item_text in existing:
+                continue
+            item = QListWidgetItem(item_text)
+            item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Unchecked)
+            self.popup_widget.addItem(item)
+            existing.add(item_text)
+        self.popup_widget.sortItems()
+        # Adding the first item makes it "current" and shows it in the line edit;
+        # keep the display text in line with the checked items
+        self.lineEdit().setText(", ".join(self.selected_items()))
+
+    def selected_items(self):
+        """Texts of the checked items."""
+        return [
             self.popup_widget.item(i).text()
             for i in range(self.popup_widget.count())
             if self.popup_widget.item(i).checkState() == Qt.Checked
         ]
+
+    def update_selection(self):
+        """Update the displayed text and emit the selected items list."""
+        selected = self.selected_items()
         self.lineEdit().setText(", ".join(selected) if selected else "")
         self.selection_changed.emit(selected)
 
@@ -73,8 +91,35 @@ class PlaneView(QWidget):
         self.presenter = presenter
         self.presenter.view = self
 
-        # Initialize cache for images
-        self.cache_manager = SimpleCache()
+
+        self.planes = []  # Planes of the current result set (loaded so far)
+
+        # FLYSMART_GRID=virtual paints the cards with a model/delegate instead of widgets
+        self.virtual_grid = GRID_MODE == "virtual"
+
+        # Cards are keyed by PlaneId: a new result set shows, hides and reorders
+        # the existing cards; only planes without a card get a new one
+        self._cards = {}                # PlaneId → PlaneCard in the current grid
+        self._card_pool = OrderedDict() # PlaneId → hidden PlaneCard (bounded, LRU)
+
+        # New cards are added in small batches by a single restartable timer
+        self._pending_planes = []
+        self._current_index = 0
+        self._batch_timer = QTimer(self)
+        self._batch_timer.setSingleShot(True)
+        self._batch_timer.timeout.connect(self._load_next_batch)
+
+        # Images of the cards in view are moved to the front of the download queue
+        self._priority_timer = QTimer(self)
+        self._priority_timer.setSingleShot(True)
+        self._priority_timer.setInterval(80)
+        self._priority_timer.timeout.connect(self._prioritize_visible_images)
+
+        # Filter changes are debounced before querying the server
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(250)
+        self._filter_timer.timeout.connect(self.presenter.load_planes)
 
         # --- Window properties ---
         self.setWindowTitle("FlySmart | Plane Manager")
@@ -218,6 +263,16 @@ class PlaneView(QWidget):
         filters.addWidget(clear_btn)
         layout.addLayout(filters)
 
+        # --- Virtualized grid (one view, painted cards) ---
+        if self.virtual_grid:
+            self.grid = PlaneGridView()
+            self.grid.plane_clicked.connect(self.open_plane_details)
+            self.scroll = self.grid  # Also a scroll area: paging below works unchanged
+            self.scroll.verticalScrollBar().valueChanged.connect(self._on_scroll)
+            layout.addWidget(self.grid)
+            self._add_status_bar(layout)
+            return
+
         # --- Scroll area with plane cards ---
         self.scroll = QScrollArea()
         self.scroll.setWidgetResizable(True)
@@ -227,9 +282,12 @@ class PlaneView(QWidget):
         self.cards_layout.setSpacing(18)
         self.cards_layout.setAlignment(Qt.AlignTop | Qt.AlignHCenter)
         self.scroll.setWidget(container)
+        self.scroll.verticalScrollBar().valueChanged.connect(self._on_scroll)
         layout.addWidget(self.scroll)
+        self._add_status_bar(layout)
 
-        # --- Status bar ---
+    def _add_status_bar(self, layout):
+        """Status line at the bottom of the window."""
         self.status_label = QLabel("Status: ⏳ Loading...")
         self.status_label.setObjectName("status")
         layout.addWidget(self.status_label)
@@ -243,23 +301,11 @@ class PlaneView(QWidget):
     # Display planes list
     # ============================================================
     def show_planes(self, planes):
-        """Display all loaded planes and refresh filters."""
-        self.planes = planes
-        makers = sorted(set(p.MadeBy for p in planes if p.MadeBy))
-        years = sorted(set(str(p.Year) for p in planes if p.Year))
-
-        self.made_by_combo.set_items(makers)
-        self.year_combo.set_items(years)
-
-        # Reset previous selections
-        for combo in [self.made_by_combo, self.year_combo]:
-            combo.lineEdit().clear()
-            for i in range(combo.popup_widget.count()):
-                item = combo.popup_widget.item(i)
-                item.setCheckState(Qt.Unchecked)
-
-        self.apply_filters()
-        self.show_status(f"✅ Loaded {len(planes)} planes")
+        """Display the first page of (server-filtered) planes and refresh filter options."""
+        self.planes = list(planes)
+        self._add_filter_options(planes)
+        self.display_cards(self.planes)
+        self._show_loaded_status()
 
         # Refresh stats dialog if it's open
         if (
@@ -267,47 +313,67 @@ class PlaneView(QWidget):
             and self.stats_dialog
             and self.stats_dialog.isVisible()
         ):
-            self.stats_dialog.update_charts(planes)
+            stats = self.presenter.get_stats()
+            if stats:
+                self.stats_dialog.update_charts(stats)
 
-    # ============================================================
-    # Filtering logic
-    # ============================================================
-    def apply_filters(self):
-        """Filter plane list based on search text, manufacturer, and year."""
+    # ------------------------------------------------------------
+    def append_planes(self, planes, immediate=False):
+        """
+        Append a further page of planes without rebuilding existing cards.
+        `immediate` places all their cards at once (streamed batches already
+        arrive in small pieces, so they skip the paced batch timer).
+        """
         if not hasattr(self, "planes"):
+            self.show_planes(planes)
             return
 
-        search_text = self.search_input.text().strip().lower()
-        selected_makers = (
-            self.made_by_combo.lineEdit().text().split(", ")
-            if self.made_by_combo.lineEdit().text()
-            else []
-        )
-        selected_years = (
-            self.year_combo.lineEdit().text().split(", ")
-            if self.year_combo.lineEdit().text()
-            else []
-        )
+        self.planes.extend(planes)
+        self._add_filter_options(planes)
 
-        filtered = []
-        for p in self.planes:
-            match_name = (
-                search_text in p.Name.lower() or search_text in p.MadeBy.lower()
-            )
-            match_maker = not selected_makers or p.MadeBy in selected_makers
-            match_year = not selected_years or str(p.Year) in selected_years
-            if match_name and match_maker and match_year:
-                filtered.append(p)
+        if self.virtual_grid:
+            self.grid.plane_model.append_planes(planes)
+            QTimer.singleShot(0, self._maybe_load_more)
+        else:
+            self._pending_planes.extend(planes)
+            if immediate:
+                self._batch_timer.stop()
+                self._load_next_batch(batch_size=len(self._pending_planes))
+            elif not self._batch_timer.isActive():
+                self._load_next_batch()
+
+        self._show_loaded_status()
+
+    def _add_filter_options(self, planes):
+        """Add manufacturers and years seen in `planes` to the filter combos."""
+        self.made_by_combo.add_items(sorted(set(p.MadeBy for p in planes if p.MadeBy)))
+        self.year_combo.add_items(sorted(set(str(p.Year) for p in planes if p.Year)))
+
+    def _show_loaded_status(self):
+        """Show how many planes are loaded (out of the server total, if known)."""
+        total = getattr(self.presenter, "total_planes", None)
+        if total is not None and total > len(self.planes):
+            self.show_status(f"✅ Loaded {len(self.planes)} of {total} planes")
+        else:
+            self.show_status(f"✅ Loaded {len(self.planes)} planes")
 
-        self.display_cards(filtered)
+    # ============================================================
+    # Filtering logic
+    # ============================================================
+    def current_filters(self):
+        """Return the active (search_text, selected_makers, selected_years)."""
+        search_text = self.search_input.text().strip()
+        # Read the check states, not the display text (names may contain ", ")
+        selected_makers = self.made_by_combo.selected_items()
+        selected_years = self.year_combo.selected_items()
+        return search_text, selected_makers, selected_years
 
-        # Update statistics if window is open
-        if (
-            hasattr(self, "stats_dialog")
-            and self.stats_dialog
-            and self.stats_dialog.isVisible()
-        ):
-            self.stats_dialog.update_charts(filtered)
+    def apply_filters(self):
+        """
+        Re-query the server with the current search text, manufacturers and years.
+        Debounced, so typing in the search box sends one request per pause.
+        """
+        self._filter_timer.start()
 
     def reset_filters(self):
         """Clear all filter selections and show all planes again."""
@@ -323,45 +389,112 @@ class PlaneView(QWidget):
     # Plane cards display
     # ============================================================
     def display_cards(self, planes):
-        """Render plane cards inside the scrollable grid."""
+        """
+        Show `planes` in the scrollable grid, reusing the cards already built.
+        - Cards of planes still in the list are kept (no new widget, no image reload)
+        - The others are hidden and parked in the card pool
+        """
+        if self.virtual_grid:
+            self.grid.plane_model.set_planes(planes)
+            QTimer.singleShot(0, self._maybe_load_more)
+            return
+
+        # Take every card out of the grid; the ones still wanted are placed again in order
         for i in reversed(range(self.cards_layout.count())):
-            w = self.cards_layout.itemAt(i).widget()
-            if w:
-                w.deleteLater()
+            self.cards_layout.takeAt(i)
+        wanted = {p.PlaneId for p in planes}
+        for plane_id in [pid for pid in self._cards if pid not in wanted]:
+            self._release_card(self._cards.pop(plane_id))
+        for card in self._cards.values():
+            card.hide()  # Shown again when it is placed
 
         self._pending_planes = list(planes)
         self._current_index = 0
+        self._batch_timer.stop()
+        self._load_next_batch()
+
+    def _load_next_batch(self, batch_size=6):
+        """Place plane cards in order; new cards are built a few at a time for smooth UI performance."""
+        created = 0
+        while self._current_index < len(self._pending_planes) and created < batch_size:
+            plane = self._pending_planes[self._current_index]
+            card, is_new = self._acquire_card(plane)
+            created += is_new
+            row, col = divmod(self._current_index, 3)
+            self.cards_layout.addWidget(card, row, col)
+            card.show()
+            self._current_index += 1
+
+        self._priority_timer.start()
+        if self._current_index < len(self._pending_planes):
+            self._batch_timer.start(150)
+        else:
+            # All known cards are shown — fetch more if the grid doesn't fill the viewport
+            QTimer.singleShot(0, self._maybe_load_more)
 
-        def load_next_batch():
-            """Load plane cards gradually for smooth UI performance."""
-            if not hasattr(self, "_pending_planes"):
-                return
-
-            batch_size = 6
-            planes_to_load = self._pending_planes[
-                self._current_index : self._current_index + batch_size
-            ]
-            if not planes_to_load:
-                return
-
-            for plane in planes_to_load:
-                card = PlaneCard(plane, self.cache_manager, self.presenter)
-                card.clicked.connect(lambda p=plane: self.open_plane_details(p))
-                row, col = divmod(self._current_index, 3)
-                self.cards_layout.addWidget(card, row, col)
-                self._current_index += 1
-
-            if self._current_index < len(self._pending_planes):
-                QTimer.singleShot(150, load_next_batch)
+    def _acquire_card(self, plane):
+        """
+        Card for `plane`: its existing card, a recycled one, or a new one.
+        Returns (card, created).
+        """
+        card = self._cards.get(plane.PlaneId) or self._card_pool.pop(plane.PlaneId, None)
+        if card is None and len(self._card_pool) >= CARD_POOL_SIZE:
+            # Pool is full: rebind its least recently hidden card instead of building one
+            _, card = self._card_pool.popitem(last=False)
+        created = card is None
+        if created:
+            card = PlaneCard(plane, self.presenter)
+            card.clicked.connect(self.open_plane_details)
+        elif card.plane != plane:
+            card.set_plane(plane)
+        else:
+            card.ensure_image()  # Its download may have been cancelled while hidden
+        self._cards[plane.PlaneId] = card
+        return card, created
+
+    def _release_card(self, card):
+        """Hide a card that left the result set and keep it in the bounded pool."""
+        card.hide()
+        card.cancel_image()
+        self._card_pool[card.plane.PlaneId] = card
+        self._card_pool.move_to_end(card.plane.PlaneId)
+        while len(self._card_pool) > CARD_POOL_SIZE:
+            _, evicted = self._card_pool.popitem(last=False)
+            evicted.dispose()
 
-        load_next_batch()
+    # ------------------------------------------------------------
+    def _on_scroll(self, value):
+        """Request the next page when the scroll area nears the bottom."""
+        self._maybe_load_more()
+        self._priority_timer.start()
+
+    def _prioritize_visible_images(self):
+        """Give the pending images of the cards inside the viewport the highest priority."""
+        if self.virtual_grid:
+            self.grid.cancel_hidden_images()
+            return
+        viewport = self.scroll.viewport()
+        area = viewport.rect()
+        for card in self._cards.values():
+            if card.isVisible() and QRect(card.mapTo(viewport, QPoint(0, 0)), card.size()).intersects(area):
+                card.prioritize_image(VISIBLE_PRIORITY)
+
+    def _maybe_load_more(self):
+        """Ask the presenter for more planes once the rendered cards run out."""
+        if self._batch_timer.isActive() or not self.presenter.has_more_planes():
+            return
+        bar = self.scroll.verticalScrollBar()
+        if bar.maximum() - bar.value() <= 2 * self.scroll.viewport().height():
+            self.presenter.load_more_planes()
 
     # ============================================================
     # Plane details dialog
     # ============================================================
     def open_plane_details(self, plane):
-        """Open modal dialog showing plane details."""
-        dialog = PlaneDetailsDialog(self, plane, self.cache_manager, self.presenter)
+        """Open modal dialog showing plane details (loads the full plane for card projections)."""
+        if plane.is_partial:
+            plane = self.presenter.get_plane_by_id(plane.PlaneId) or plane
+        dialog = PlaneDetailsDialog(self, plane, self.presenter)
         self.active_details_dialog = dialog
         dialog.exec()
         self.active_details_dialog = None
@@ -370,23 +503,33 @@ class PlaneView(QWidget):
     # Plane card helper functions
     # ============================================================
     def add_plane_card(self, plane):
-        """Add new plane card to grid layout."""
-        card = PlaneCard(plane, self.cache_manager, self.presenter)
-        card.clicked.connect(lambda p=plane: self.open_plane_details(p))
-        total = self.cards_layout.count()
-        row, col = divmod(total, 3)
-        self.cards_layout.addWidget(card, row, col)
+        """Add new plane card to grid layout (after any cards still being loaded)."""
+        self.planes.append(plane)
+        self._add_filter_options([plane])
+        if self.virtual_grid:
+            self.grid.plane_model.append_planes([plane])
+        else:
+            self._pending_planes.append(plane)
+            if not self._batch_timer.isActive():
+                self._load_next_batch()
         self.show_status(f"✅ Plane '{plane.Name}' added.")
 
     def refresh_plane_card(self, updated_plane):
         """Refresh a plane card after editing its details."""
-        for i in range(self.cards_layout.count()):
-            w = self.cards_layout.itemAt(i).widget()
-            if hasattr(w, "plane") and w.plane.PlaneId == updated_plane.PlaneId:
-                w.plane = updated_plane
-                w._fade_in_image(None)
-                w.repaint()
-                break
+        for planes in (self.planes, self._pending_planes):
+            for i, p in enumerate(planes):
+                if p.PlaneId == updated_plane.PlaneId:
+                    planes[i] = updated_plane
+        self._add_filter_options([updated_plane])
+
+        if self.virtual_grid:
+            self.grid.plane_model.update_plane(updated_plane)
+            self.show_status(f"✏️ Plane '{updated_plane.Name}' updated.")
+            return
+
+        card = self._cards.get(updated_plane.PlaneId)
+        if card is not None:
+            card.set_plane(updated_plane)
         self.show_status(f"✏️ Plane '{updated_plane.Name}' updated.")
 
     def remove_plane_card(self, plane_id):
@@ -402,12 +545,21 @@ class PlaneView(QWidget):
             except Exception:
                 pass
 
-        for i in reversed(range(self.cards_layout.count())):
-            w = self.cards_layout.itemAt(i).widget()
-            if hasattr(w, "plane") and w.plane.PlaneId == plane_id:
-                w.deleteLater()
+        self.planes = [p for p in self.planes if p.PlaneId != plane_id]
+        # Drop it from the cards not rendered yet (rendered ones are removed below)
+        for i in range(self._current_index, len(self._pending_planes)):
+            if self._pending_planes[i].PlaneId == plane_id:
+                del self._pending_planes[i]
                 break
 
+        if self.virtual_grid:
+            self.grid.plane_model.remove_plane(plane_id)
+        else:
+            card = self._cards.pop(plane_id, None) or self._card_pool.pop(plane_id, None)
+            if card is not None:
+                self.cards_layout.removeWidget(card)
+                card.dispose()
+
         self.show_status("🗑️ Plane deleted successfully.")
 
     # ============================================================
@@ -415,13 +567,8 @@ class PlaneView(QWidget):
     # ============================================================
     def show_stats_dialog(self):
         """Open or refresh the statistics dialog window."""
-        filtered_planes = []
-        if hasattr(self, "_pending_planes"):
-            filtered_planes = self._pending_planes
-        elif hasattr(self, "planes"):
-            filtered_planes = self.planes
-
-        if not filtered_planes:
+        stats = self.presenter.get_stats()
+        if not stats or not stats.get("total"):
             QMessageBox.information(self, "No Data", "No planes to display in statistics.")
             return
 
@@ -430,11 +577,11 @@ class PlaneView(QWidget):
             and self.stats_dialog
             and self.stats_dialog.isVisible()
         ):
-            self.stats_dialog.update_charts(filtered_planes)
+            self.stats_dialog.update_charts(stats)
             self.stats_dialog.raise_()
             self.stats_dialog.activateWindow()
         else:
-            self.stats_dialog = PlaneStatsDialog(filtered_planes, self)
+            self.stats_dialog = PlaneStatsDialog(stats, self)
             self.stats_dialog.show()
 
     # ============================================================
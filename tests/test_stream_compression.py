@@ -0,0 +1,90 @@
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import asyncio
+import json
+from backend.controller import blobs, crud
+from backend.controller.routers import STREAM_CHUNK_ROWS
+from backend.model.db import SessionLocal, ensure_schema
+from backend.model.schemas import PlaneCreate
+from backend.view.main import app
+
+ROWS = 2000
+
+
+def setup_module(module):
+    ensure_schema()
+    with SessionLocal() as db:
+        crud.bulk_create_planes(db, [
+            PlaneCreate(Name=f"Plane {i}", Year=2000, MadeBy="Boeing",
+                        NumOfSeats1=1, NumOfSeats2=2, NumOfSeats3=3)
+            for i in range(ROWS)
+        ])
+
+
+def _get(path: str, headers: dict) -> list:
+    """Run one GET through the ASGI app and return every message it sent."""
+    messages = []
+    requested = False
+    finished = asyncio.Event()
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+        if message["type"] == "http.response.body" and not message.get("more_body"):
+            finished.set()
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+        "root_path": "", "query_string": b"", "client": ("test", 1), "server": ("test", 80),
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+    }
+    async def run():
+        await app(scope, receive, send)
+        finished.set()
+
+    asyncio.run(run())
+    return messages
+
+
+def test_stream_sends_rows_as_they_are_produced():
+    messages = _get("/planes/stream", {"Accept-Encoding": "gzip"})
+    headers = dict(messages[0]["headers"])
+    assert b"content-encoding" not in headers
+
+    bodies = [m for m in messages[1:] if m.get("body")]
+    # The first message already carries complete rows while more body is pending
+    first = bodies[0]
+    assert first["more_body"]
+    lines = first["body"].decode().splitlines()
+    assert len(lines) == STREAM_CHUNK_ROWS
+    assert json.loads(lines[0])["Name"] == "Plane 0"
+    assert sum(len(m["body"].splitlines()) for m in bodies) == ROWS
+
+
+def test_json_responses_are_still_compressed():
+    messages = _get("/planes/", {"Accept-Encoding": "gzip"})
+    assert dict(messages[0]["headers"]).get(b"content-encoding") == b"gzip"
+
+
+def test_images_are_sent_as_stored(tmp_path, monkeypatch):
+    monkeypatch.setattr(blobs, "BLOB_DIR", str(tmp_path))
+    name = "ab" * 32 + ".png"
+    data = b"\x89PNG\r\n\x1a\n" + bytes(4096)
+    (tmp_path / name[:2]).mkdir()
+    (tmp_path / name[:2] / name).write_bytes(data)
+
+    messages = _get(f"/blobs/{name}", {"Accept-Encoding": "gzip"})
+    headers = dict(messages[0]["headers"])
+    assert messages[0]["status"] == 200
+    assert b"content-encoding" not in headers
+    assert b"".join(m.get("body", b"") for m in messages[1:]) == data